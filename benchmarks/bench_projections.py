@@ -0,0 +1,203 @@
+"""
+Benchmarks for the AAS and projection hot paths on synthetic league-sized game logs.
+
+Generates game logs in the two data/game_logs schemas (nba_api box scores for
+the AAS scripts, checklist rows for player_game.py), times each stage, and
+reports throughput and peak traced memory. Results can be saved as a baseline
+JSON and later runs compared against it to catch regressions.
+
+Usage:
+    python -m benchmarks.bench_projections --sizes 1000 10000 100000
+    python -m benchmarks.bench_projections --save-baseline
+    python -m benchmarks.bench_projections --compare --tolerance 0.25
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.projections.aas import calculate_aas
+from src.projections.player_game import backtest_recent_games, engineer_features
+
+l10_aas = importlib.import_module("src.projections.calculate_l10_aas")
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+GAMES_PER_PLAYER = 82
+OPPONENTS = ["ATL", "BOS", "BKN", "CHA", "CHI", "CLE", "DAL", "DEN", "DET", "GSW", "HOU", "IND", "LAC", "LAL", "MEM"]
+
+
+def synthetic_box_scores(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    nba_api PlayerGameLog-style rows (PTS, REB, ..., MATCHUP, GAME_DATE) for n_rows / 82 players.
+    """
+    rng = np.random.default_rng(seed)
+    player_ids = np.arange(n_rows) // GAMES_PER_PLAYER
+    rest = rng.choice([1, 1, 2, 2, 2, 3, 4], size=n_rows)
+    days = pd.Series(rest).groupby(player_ids).cumsum().to_numpy()
+    dates = pd.Timestamp("2023-10-24") + pd.to_timedelta(days, unit="D")
+    home = rng.random(n_rows) < 0.5
+    opponents = rng.choice(OPPONENTS, size=n_rows)
+    return pd.DataFrame({
+        "PLAYER_ID": player_ids,
+        "SEASON": "2023-24",
+        "GAME_DATE": dates.strftime("%b %d, %Y"),
+        "MATCHUP": np.where(home, "OKC vs. " + opponents, "OKC @ " + opponents),
+        "MIN": rng.integers(10, 40, n_rows),
+        "PTS": rng.poisson(14, n_rows),
+        "REB": rng.poisson(5, n_rows),
+        "AST": rng.poisson(3, n_rows),
+        "STL": rng.poisson(1, n_rows),
+        "BLK": rng.poisson(0.6, n_rows),
+        "TOV": rng.poisson(1.5, n_rows),
+        "FG3M": rng.poisson(1.5, n_rows),
+    })
+
+
+def synthetic_checklist_rows(n_rows: int, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Rows in the player_game.load_game_logs schema (data/game_logs/lebron_james.csv), oldest first.
+    """
+    rng = np.random.default_rng(seed)
+    start = datetime(2000, 1, 1)
+    minutes = rng.normal(32, 4, n_rows)
+    usage = rng.normal(28, 2.5, n_rows)
+    ts = rng.normal(0.58, 0.04, n_rows)
+    pace = rng.normal(100, 3, n_rows)
+    opp_def = rng.normal(112, 3, n_rows)
+    sorare = 0.8 * minutes + 0.5 * usage + 30 * ts + rng.normal(0, 5, n_rows)
+    return [
+        {
+            "game_date": start + timedelta(days=2 * i),
+            "opponent": OPPONENTS[i % len(OPPONENTS)],
+            "minutes": float(minutes[i]),
+            "usage_rate": float(usage[i]),
+            "true_shooting_pct": float(ts[i]),
+            "sorare_score": float(sorare[i]),
+            "pace": float(pace[i]),
+            "opponent_def_rating": float(opp_def[i]),
+        }
+        for i in range(n_rows)
+    ]
+
+
+# Each stage: (name, data kind, setup(data) -> args, function)
+STAGES: List[Tuple[str, str, Callable, Callable]] = [
+    ("calculate_aas", "box", lambda df: (df,), calculate_aas),
+    ("calculate_baseline_stats", "box", lambda df: (df.copy(),), l10_aas.calculate_baseline_stats),
+    ("identify_back_to_backs", "box", lambda df: (df.copy(),), l10_aas.identify_back_to_backs),
+    ("engineer_features", "rows", lambda rows: (rows,), engineer_features),
+    ("backtest_recent_games", "rows", lambda rows: (rows, 5), backtest_recent_games),
+]
+
+
+def _measure(setup: Callable, fn: Callable, data, repeat: int) -> Tuple[float, int]:
+    """
+    Returns the best wall time over `repeat` runs and the peak traced memory of one run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        args = setup(data)
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+
+    args = setup(data)
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(sizes: List[int], stages: List[str], repeat: int, max_list_rows: int) -> List[Dict[str, object]]:
+    results = []
+    for n_rows in sizes:
+        data = {"box": synthetic_box_scores(n_rows), "rows": synthetic_checklist_rows(min(n_rows, max_list_rows))}
+        for name, kind, setup, fn in STAGES:
+            if name not in stages:
+                continue
+            if kind == "rows" and n_rows > max_list_rows:
+                print(f"{name:<26} {n_rows:>9,} rows  skipped (above --max-list-rows)")
+                continue
+            seconds, peak = _measure(setup, fn, data[kind], repeat)
+            results.append({
+                "stage": name,
+                "rows": n_rows,
+                "seconds": seconds,
+                "rows_per_second": n_rows / seconds if seconds else float("inf"),
+                "peak_memory_mb": peak / 1e6,
+            })
+            print(f"{name:<26} {n_rows:>9,} rows  {seconds:>9.4f}s  {n_rows / seconds:>13,.0f} rows/s  {peak / 1e6:>9.1f} MB")
+    return results
+
+
+def compare_to_baseline(results: List[Dict[str, object]], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    """
+    Returns a message for every stage/size that is slower than the baseline by more than `tolerance`.
+    """
+    previous = {(r["stage"], r["rows"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get((result["stage"], result["rows"]))
+        if before is None:
+            continue
+        ratio = result["seconds"] / before["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{result['stage']} @ {result['rows']:,} rows: {before['seconds']:.4f}s -> {result['seconds']:.4f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    stage_names = [name for name, *_ in STAGES]
+    parser = argparse.ArgumentParser(description="Benchmark the AAS/projection hot paths on synthetic game logs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Row counts to benchmark (1k to 1M).")
+    parser.add_argument("--stages", nargs="+", default=stage_names, choices=stage_names, help="Stages to run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the best is reported.")
+    parser.add_argument("--max-list-rows", type=int, default=100_000, help="Largest size run through the list-of-dict player_game stages.")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Path of the baseline JSON.")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline.")
+    parser.add_argument("--compare", action="store_true", help="Fail if any stage is slower than the baseline beyond --tolerance.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown versus the baseline (0.2 = 20%%).")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.stages, args.repeat, args.max_list_rows)
+
+    if args.save_baseline:
+        payload = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": results,
+        }
+        with open(args.baseline, "w") as f:
+            json.dump(payload, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\nPerformance regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            raise SystemExit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,9 +54,10 @@ def main():
             
         if 0 < choice_num <= len(scripts):
             selected_script = scripts[choice_num - 1]
-            script_full_path = os.path.join(script_path, selected_script)
+            module_name = os.path.splitext(selected_script)[0]
             
-            command = [sys.executable, script_full_path]
+            # Run as a module so the scripts' package-relative imports resolve
+            command = [sys.executable, "-m", f"src.projections.{module_name}"]
             
             # Special handling for scripts that require arguments
             if selected_script == "scrape_player_stats.py":
@@ -1,103 +1,43 @@
-from nba_api.stats.static import players, teams
-from nba_api.stats.endpoints import leaguestandings
 import pandas as pd
 import argparse
-from datetime import datetime, timedelta
-import os
-import time
-from thefuzz import process
-from requests.exceptions import ReadTimeout
-
-def get_player_id(player_name):
+from datetime import datetime
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from .aas import AAS_SCORING, add_opponent_adjusted_aas, calculate_aas
+from .game_log_store import GameLogStore
+from .instrumentation import INSTRUMENTATION, player, stage
+from .nba_api_client import RATE_LIMITER
+from .player_index import get_player_index
+from .result_cache import RESULT_CACHE_DIR, ResultCache, content_key, write_artifact_if_changed
+from .rolling_form import TREND_WINDOWS, get_rolling_form_store
+from .schedule import add_schedule_flags, load_schedule, schedule_version
+from .standings import get_last_n_seasons, get_standings_cache, get_win_percentage_table
+from .stat_projections import DEFAULT_WINDOW_WEIGHTS, parse_window_weights, project_stats
+
+def get_player_id(player_name, out=sys.stdout):
     """
-    Gets the player ID for a given player name from the player.csv file.
+    Gets the active player ID for a given player name from the shared player-name index.
     """
-    try:
-        players_df = pd.read_csv("csv/player.csv")
-    except FileNotFoundError:
-        print("Error: player.csv not found.")
+    index = get_player_index()
+    player = index.exact(player_name)
+    if player is not None:
+        return player.id
+
+    print(f"Could not find an exact match for {player_name}, trying fuzzy matching...", file=out)
+    best_match = index.resolve(player_name)
+    if best_match is None:
         return None
-
-    active_players_df = players_df[players_df['is_active'] == 1]
-    player = active_players_df[active_players_df['full_name'].str.lower() == player_name.lower()]
-
-    if not player.empty:
-        return player.iloc[0]['id']
-    else:
-        print(f"Could not find an exact match for {player_name}, trying fuzzy matching...")
-        all_player_names = active_players_df['full_name'].tolist()
-        best_match = process.extractOne(player_name, all_player_names)
-        if best_match and best_match[1] > 80:  # Confidence threshold
-            print(f"Found best match: {best_match[0]}")
-            return active_players_df[active_players_df['full_name'] == best_match[0]].iloc[0]['id']
-        else:
-            return None
-
-def get_last_n_seasons(n):
-    """
-    Gets a list of the last n season strings.
-    """
-    now = datetime.now()
-    current_year = now.year
-    if now.month < 10:
-        current_year -= 1
-    
-    seasons = []
-    for i in range(n):
-        start_year = current_year - i
-        end_year = (start_year + 1) % 100
-        seasons.append(f"{start_year}-{end_year:02d}")
-    return seasons
+    print(f"Found best match: {best_match.full_name}", file=out)
+    return best_match.id
 
 def get_player_game_log(player_id, seasons):
     """
     Gets the game log for a given player ID and a list of seasons, including usage stats.
+    Reads from the local season-partitioned store (see game_log_store.py).
     """
-    # TODO: Implement data fetching from CSV files.
-    return pd.DataFrame()
-
-def get_team_win_percentages(seasons):
-    """
-    Gets the win percentages for all teams for a list of seasons.
-    """
-    win_percentages = {}
-    for season in seasons:
-        standings = make_api_request(leaguestandings.LeagueStandings, season=season)
-        if standings:
-            season_percentages = {}
-            df = standings.get_data_frames()[0]
-            for index, row in df.iterrows():
-                team_id = row['TeamID']
-                team_abbreviation = teams.find_team_name_by_id(team_id)['abbreviation']
-                season_percentages[team_abbreviation] = row['WinPCT']
-            win_percentages[season] = season_percentages
-    return win_percentages
-
-def calculate_aas(stats):
-    """
-    Calculates the All-Around Score (AAS) for a single game.
-    """
-    aas = 0
-    aas += stats["PTS"] * 1
-    aas += stats["REB"] * 1.2
-    aas += stats["AST"] * 1.5
-    aas += stats["BLK"] * 3
-    aas += stats["STL"] * 3
-    aas += stats["TOV"] * -2
-    aas += stats["FG3M"] * 1
-
-    # Check for double-double and triple-double
-    double_digit_stats = 0
-    for stat in ["PTS", "REB", "AST", "STL", "BLK"]:
-        if stats[stat] >= 10:
-            double_digit_stats += 1
-    
-    if double_digit_stats >= 2:
-        aas += 1
-    if double_digit_stats >= 3:
-        aas += 1 # An additional point for a triple-double
-
-    return aas
+    return GameLogStore().read(player_id, seasons)
 
 def calculate_baseline_stats(df):
     """
@@ -106,20 +46,27 @@ def calculate_baseline_stats(df):
     if df.empty:
         return 0, 0, 0, pd.DataFrame()
         
-    df['AAS'] = df.apply(calculate_aas, axis=1)
+    df['AAS'] = calculate_aas(df)
         
     baseline_aas = df['AAS'].mean()
     std_dev_aas = df['AAS'].std()
     avg_usg_pct = df['usgPct'].mean() if 'usgPct' in df.columns else 0
     return baseline_aas, std_dev_aas, avg_usg_pct, df
 
-def calculate_short_term_trends(df):
+def calculate_short_term_trends(df, player_id=None):
     """
     Calculates the L10, L30, and L50 AAS from a DataFrame of games.
+    Windows held by the rolling form store, when it is current through the player's latest game,
+    are read from it instead of being recomputed.
     """
+    stored = {}
+    if player_id is not None and not df.empty:
+        stored = get_rolling_form_store().trends_through(player_id, pd.to_datetime(df['GAME_DATE']).max())
     trends = {}
-    for n in [10, 30, 50]:
-        if len(df) >= n:
+    for n in TREND_WINDOWS:
+        if stored.get(f"L{n}") is not None:
+            trends[f"L{n}"] = stored[f"L{n}"]
+        elif len(df) >= n:
             trends[f"L{n}"] = df.head(n)['AAS'].mean()
         else:
             trends[f"L{n}"] = None
@@ -127,52 +74,51 @@ def calculate_short_term_trends(df):
 
 def identify_back_to_backs(df):
     """
-    Identifies back-to-back games in a game log.
+    Identifies back-to-back games in a game log, along with the other schedule-density flags.
+    Flags are joined from the player-game schedule table when it has been built.
     """
     df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'])
-    df = df.sort_values(by='GAME_DATE', ascending=False)
-    df['IS_B2B'] = df['GAME_DATE'].diff(-1) == timedelta(days=1)
-    return df
+    df = add_schedule_flags(df, load_schedule())
+    return df.sort_values(by='GAME_DATE', ascending=False)
 
-def calculate_individual_stat_projections(df):
+def calculate_individual_stat_projections(df, window_weights=None):
     """
     Calculates projected individual stats based on a weighted average of long-term and short-term performance.
     """
-    stats_to_project = ["PTS", "REB", "AST", "STL", "BLK", "TOV", "FG3M"]
-    projections = {}
-
-    for stat in stats_to_project:
-        long_term_avg = df[stat].mean()
-        short_term_avg = df.head(10)[stat].mean()
-        projected_stat = (long_term_avg * 0.5) + (short_term_avg * 0.5)
-        projections[f"Projected_{stat}"] = projected_stat
+    projections = project_stats(df.assign(PLAYER_ID=0), window_weights)
+    return projections.iloc[0].to_dict() if not projections.empty else {}
 
-    return projections
-
-def process_player(player_name, num_seasons, output_file):
+def process_player(player_name, num_seasons, opponent_window=10, out=sys.stdout, window_weights=None, projections=None):
     """
-    Processes a single player and prints their stats.
+    Processes a single player, prints their stats to `out` and returns the results row (None if skipped).
+    `projections` takes precomputed Projected_* values (see process_players) instead of recomputing them.
     """
-    player_id = get_player_id(player_name)
+    with stage("resolve"):
+        player_id = get_player_id(player_name, out)
 
     if not player_id:
-        print(f"Could not find player ID for {player_name}")
+        print(f"Could not find player ID for {player_name}", file=out)
         return
 
     seasons_to_fetch = get_last_n_seasons(num_seasons)
-    print(f"\nFetching data for {player_name} for the following seasons: {', '.join(seasons_to_fetch)}")
+    print(f"\nFetching data for {player_name} for the following seasons: {', '.join(seasons_to_fetch)}", file=out)
     
-    game_log_df = get_player_game_log(player_id, seasons_to_fetch)
+    with stage("game_logs"):
+        game_log_df = get_player_game_log(player_id, seasons_to_fetch)
+        INSTRUMENTATION.add_rows(len(game_log_df))
     if game_log_df.empty:
-        print(f"No games found for {player_name} in the specified seasons.")
+        print(f"No games found for {player_name} in the specified seasons.", file=out)
         return
 
-    team_win_percentages = get_team_win_percentages(seasons_to_fetch)
+    with stage("standings"):
+        win_pct_table = get_win_percentage_table(seasons_to_fetch)
 
-    baseline_aas, std_dev_aas, avg_usg_pct, game_log_df_with_aas = calculate_baseline_stats(game_log_df)
-    trends = calculate_short_term_trends(game_log_df_with_aas)
-    game_log_df_with_aas = identify_back_to_backs(game_log_df_with_aas)
-    individual_projections = calculate_individual_stat_projections(game_log_df_with_aas)
+    with stage("aas", rows=len(game_log_df)):
+        baseline_aas, std_dev_aas, avg_usg_pct, game_log_df_with_aas = calculate_baseline_stats(game_log_df)
+        trends = calculate_short_term_trends(game_log_df_with_aas, player_id)
+        game_log_df_with_aas = identify_back_to_backs(game_log_df_with_aas)
+        game_log_df_with_aas = add_opponent_adjusted_aas(game_log_df_with_aas, win_pct_table)
+        individual_projections = projections if projections is not None else calculate_individual_stat_projections(game_log_df_with_aas, window_weights)
 
     home_games = game_log_df_with_aas[game_log_df_with_aas['MATCHUP'].str.contains('vs.')]
     away_games = game_log_df_with_aas[game_log_df_with_aas['MATCHUP'].str.contains('@')]
@@ -182,84 +128,161 @@ def process_player(player_name, num_seasons, output_file):
     away_aas = away_games['AAS'].mean()
     b2b_aas = b2b_games['AAS'].mean()
 
-    print(f"\n--- Long-Term Player Profile (Last {num_seasons} Seasons) ---")
-    print(f"Baseline Pace-Adjusted AAS: {baseline_aas:.2f}")
-    print(f"AAS Standard Deviation (Consistency): {std_dev_aas:.2f}")
-    print(f"Average USG%: {avg_usg_pct:.2%}")
+    print(f"\n--- Long-Term Player Profile (Last {num_seasons} Seasons) ---", file=out)
+    print(f"Baseline Pace-Adjusted AAS: {baseline_aas:.2f}", file=out)
+    print(f"AAS Standard Deviation (Consistency): {std_dev_aas:.2f}", file=out)
+    print(f"Average USG%: {avg_usg_pct:.2%}", file=out)
 
-    print(f"\n--- Short-Term Performance Trends ---")
+    print(f"\n--- Short-Term Performance Trends ---", file=out)
     for trend, value in trends.items():
         if value is not None:
-            print(f"{trend} Pace-Adjusted AAS: {value:.2f}")
-        else:
-            print(f"{trend} Pace-Adjusted AAS: Not enough data")
-
-    print(f"\n--- Contextual Performance Analysis (Last {num_seasons} Seasons) ---")
-    print(f"Home Pace-Adjusted AAS: {home_aas:.2f}")
-    print(f"Away Pace-Adjusted AAS: {away_aas:.2f}")
-    print(f"Back-to-Back Pace-Adjusted AAS: {b2b_aas:.2f}")
-
-    print(f"\n--- Opponent-Adjusted AAS (Last 10 Games) ---")
-    last_10_games = game_log_df_with_aas.head(10)
-    opponent_adjusted_aas_list = []
-    for index, game in last_10_games.iterrows():
-        matchup = game['MATCHUP']
-        if " vs. " in matchup:
-            opponent_abbr = matchup.split(" vs. ")[1]
-        elif " @ " in matchup:
-            opponent_abbr = matchup.split(" @ ")[1]
+            print(f"{trend} Pace-Adjusted AAS: {value:.2f}", file=out)
         else:
-            opponent_abbr = ""
+            print(f"{trend} Pace-Adjusted AAS: Not enough data", file=out)
 
-        game_season = game['SEASON']
-        opponent_win_pct = team_win_percentages.get(game_season, {}).get(opponent_abbr, 0.5)
-        
-        opponent_adjusted_aas = game['AAS'] * opponent_win_pct
-        opponent_adjusted_aas_list.append(opponent_adjusted_aas)
+    print(f"\n--- Contextual Performance Analysis (Last {num_seasons} Seasons) ---", file=out)
+    print(f"Home Pace-Adjusted AAS: {home_aas:.2f}", file=out)
+    print(f"Away Pace-Adjusted AAS: {away_aas:.2f}", file=out)
+    print(f"Back-to-Back Pace-Adjusted AAS: {b2b_aas:.2f}", file=out)
 
+    print(f"\n--- Opponent-Adjusted AAS (Last {opponent_window} Games) ---", file=out)
+    recent_games = game_log_df_with_aas.head(opponent_window)
+    for index, game in recent_games.iterrows():
         if 'usgPct' in game:
-            print(f"Date: {game['GAME_DATE'].date()}, Opp: {opponent_abbr} (Win %: {opponent_win_pct:.3f}), Opponent-Adjusted AAS: {opponent_adjusted_aas:.2f}, USG%: {game['usgPct']:.2%}")
+            print(f"Date: {game['GAME_DATE'].date()}, Opp: {game['OPPONENT']} (Win %: {game['OPPONENT_WIN_PCT']:.3f}), Opponent-Adjusted AAS: {game['OPP_ADJ_AAS']:.2f}, USG%: {game['usgPct']:.2%}", file=out)
         else:
-            print(f"Date: {game['GAME_DATE'].date()}, Opp: {opponent_abbr} (Win %: {opponent_win_pct:.3f}), Opponent-Adjusted AAS: {opponent_adjusted_aas:.2f}")
+            print(f"Date: {game['GAME_DATE'].date()}, Opp: {game['OPPONENT']} (Win %: {game['OPPONENT_WIN_PCT']:.3f}), Opponent-Adjusted AAS: {game['OPP_ADJ_AAS']:.2f}", file=out)
 
     # Composite Score
     l10_aas = trends.get('L10', baseline_aas)
-    l10_opponent_adjusted_aas = sum(opponent_adjusted_aas_list) / len(opponent_adjusted_aas_list) if opponent_adjusted_aas_list else 0
+    opponent_adjusted_window = recent_games['OPP_ADJ_AAS']
+    recent_opponent_adjusted_aas = opponent_adjusted_window.mean() if not opponent_adjusted_window.empty else 0
     
-    composite_score = (baseline_aas * 0.4) + (l10_aas * 0.4) + (l10_opponent_adjusted_aas * 0.2)
-    print(f"\n--- Composite Score ---")
-    print(f"Predictive Pace-Adjusted AAS: {composite_score:.2f}")
+    composite_score = (baseline_aas * 0.4) + (l10_aas * 0.4) + (recent_opponent_adjusted_aas * 0.2)
+    print(f"\n--- Composite Score ---", file=out)
+    print(f"Predictive Pace-Adjusted AAS: {composite_score:.2f}", file=out)
 
-    print(f"\n--- Individual Stat Projections ---")
+    print(f"\n--- Individual Stat Projections ---", file=out)
     for stat, value in individual_projections.items():
-        print(f"{stat}: {value:.2f}")
-
-    # Save results to CSV
-    if output_file:
-        results_to_save = {
-            "Player": player_name,
-            "Baseline_Pace_Adjusted_AAS": baseline_aas,
-            "AAS_Std_Dev": std_dev_aas,
-            "Avg_USG_Pct": avg_usg_pct,
-            "L10_Pace_Adjusted_AAS": trends.get('L10'),
-            "L30_Pace_Adjusted_AAS": trends.get('L30'),
-            "L50_Pace_Adjusted_AAS": trends.get('L50'),
-            "Home_Pace_Adjusted_AAS": home_aas,
-            "Away_Pace_Adjusted_AAS": away_aas,
-            "B2B_Pace_Adjusted_AAS": b2b_aas,
-            "Composite_Predictive_Pace_Adjusted_AAS": composite_score,
-            **individual_projections
-        }
-        results_df = pd.DataFrame([results_to_save])
-        file_exists = os.path.isfile(output_file)
-        results_df.to_csv(output_file, mode='a', header=not file_exists, index=False)
-        print(f"\nResults for {player_name} saved to {output_file}")
+        print(f"{stat}: {value:.2f}", file=out)
+
+    return {
+        "Player": player_name,
+        "Baseline_Pace_Adjusted_AAS": baseline_aas,
+        "AAS_Std_Dev": std_dev_aas,
+        "Avg_USG_Pct": avg_usg_pct,
+        "L10_Pace_Adjusted_AAS": trends.get('L10'),
+        "L30_Pace_Adjusted_AAS": trends.get('L30'),
+        "L50_Pace_Adjusted_AAS": trends.get('L50'),
+        "Home_Pace_Adjusted_AAS": home_aas,
+        "Away_Pace_Adjusted_AAS": away_aas,
+        "B2B_Pace_Adjusted_AAS": b2b_aas,
+        "Composite_Predictive_Pace_Adjusted_AAS": composite_score,
+        **individual_projections
+    }
+
+def player_cache_key(player_name, num_seasons, opponent_window, window_weights=None):
+    """
+    Content key for a player's analysis: player id, season window, scoring config and input data versions.
+    Returns None when the name does not resolve, so unresolved players are never cached.
+    """
+    match = get_player_index().resolve(player_name)
+    if match is None:
+        return None
+    seasons = get_last_n_seasons(num_seasons)
+    standings = get_standings_cache()
+    return content_key({
+        "player_name": player_name,
+        "player_id": match.id,
+        "seasons": seasons,
+        "opponent_window": opponent_window,
+        "projection_weights": sorted((window or 0, weight) for window, weight in (window_weights or DEFAULT_WINDOW_WEIGHTS).items()),
+        "scoring": AAS_SCORING.fingerprint,
+        "game_logs": GameLogStore().version(seasons),
+        "standings": {season: standings.version(season) for season in seasons},
+        "schedule": schedule_version(),
+    })
+
+def run_player(player_name, num_seasons, opponent_window, cache=None, window_weights=None, projections=None):
+    """
+    Runs process_player with its output captured, isolating any failure to this player.
+    With a cache, unchanged players are served from their stored result and report.
+    Returns (results row or None, report text).
+    """
+    out = io.StringIO()
+    try:
+        with player(player_name):
+            with stage("cache"):
+                key = player_cache_key(player_name, num_seasons, opponent_window, window_weights) if cache is not None else None
+                cached = cache.get(key) if key is not None else None
+            if cached is not None:
+                return cached["results"], cached["report"]
+            results = process_player(player_name, num_seasons, opponent_window, out, window_weights, projections)
+            if key is not None and results is not None:
+                cache.put(key, {"results": results, "report": out.getvalue()})
+    except Exception as e:
+        print(f"Error processing {player_name}: {e}", file=out)
+        results = None
+    return results, out.getvalue()
+
+def project_players(player_names, num_seasons, window_weights=None):
+    """
+    Projects every resolvable player's stats in one stacked read and one groupby pass.
+    Returns {player_name: {Projected_<STAT>: value}} for players with games in the store.
+    """
+    index = get_player_index()
+    player_ids = {}
+    for name in player_names:
+        match = index.resolve(name)
+        if match is not None:
+            player_ids[name] = match.id
+    if not player_ids:
+        return {}
+
+    game_logs = GameLogStore().read_players(list(set(player_ids.values())), get_last_n_seasons(num_seasons))
+    if game_logs.empty:
+        return {}
+    projections = project_stats(game_logs, window_weights)
+    return {
+        name: projections.loc[player_id].to_dict()
+        for name, player_id in player_ids.items()
+        if player_id in projections.index
+    }
+
+def process_players(player_names, num_seasons, opponent_window=10, workers=8, cache=None, window_weights=None):
+    """
+    Processes many players concurrently under the shared nba_api rate limit.
+    Reports are printed and results returned in input order, regardless of completion order.
+    """
+    with stage("projections"):
+        projections = project_players(player_names, num_seasons, window_weights)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            executor.submit(run_player, name, num_seasons, opponent_window, cache, window_weights, projections.get(name))
+            for name in player_names
+        ]
+        all_results = []
+        for future in futures:
+            results, report = future.result()
+            print(report, end="")
+            if results is not None:
+                all_results.append(results)
+    return all_results
 
 def main():
     parser = argparse.ArgumentParser(description="Calculate advanced stats for a list of NBA players based on historical data.")
     parser.add_argument("--input-file", default="data/player_list.txt", help="Path to a text file with player names (one per line).")
     parser.add_argument("--seasons", type=int, default=3, help="The number of past seasons to analyze.")
+    parser.add_argument("--opponent-window", type=int, default=10, help="Number of recent games of opponent-adjusted AAS used in the composite score.")
+    parser.add_argument("--standings-ttl", type=float, default=12.0, help="Hours before cached current-season standings are refetched.")
+    parser.add_argument("--workers", type=int, default=8, help="Number of players processed concurrently.")
+    parser.add_argument("--requests-per-second", type=float, help="Override the shared nba_api request budget.")
+    parser.add_argument("--projection-weights", type=parse_window_weights, default=DEFAULT_WINDOW_WEIGHTS, help="Window weights for the Projected_* stats, e.g. 'all:0.5,10:0.5'.")
+    parser.add_argument("--profile", action="store_true", help="Record per-stage/per-player timings and API usage and print a summary.")
+    parser.add_argument("--profile-json", help="Also write the profile records to this JSON file (implies --profile).")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every player instead of reusing cached results.")
     args = parser.parse_args()
+    get_standings_cache(args.standings_ttl)
 
     try:
         with open(args.input_file, "r") as f:
@@ -267,14 +290,30 @@ def main():
     except FileNotFoundError:
         raise SystemExit(f"Input file not found: {args.input_file}")
 
+    if args.requests_per_second:
+        RATE_LIMITER.rate = args.requests_per_second
+    if args.profile or args.profile_json:
+        INSTRUMENTATION.enable()
+
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     output_file = f"outputs/player_analysis_{timestamp}.csv"
 
-    for player_name in player_names:
-        process_player(player_name, args.seasons, output_file)
-        time.sleep(1) # Add a 1-second delay between player processing
-
+    cache = None if args.no_cache else ResultCache()
+    all_results = process_players(player_names, args.seasons, args.opponent_window, args.workers, cache, args.projection_weights)
+    if all_results:
+        manifest_path = RESULT_CACHE_DIR / "player_analysis_latest.json"
+        with stage("write", rows=len(all_results)):
+            path, written = write_artifact_if_changed(pd.DataFrame(all_results), output_file, manifest_path)
+        if written:
+            print(f"\nResults for {len(all_results)}/{len(player_names)} players saved to {path}")
+        else:
+            print(f"\nResults for {len(all_results)}/{len(player_names)} players unchanged since {path}")
 
+    if INSTRUMENTATION.enabled:
+        print("\n" + INSTRUMENTATION.report())
+        if args.profile_json:
+            INSTRUMENTATION.write_json(args.profile_json)
+            print(f"Profile written to {args.profile_json}")
 
 if __name__ == "__main__":
     main()
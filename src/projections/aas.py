@@ -0,0 +1,43 @@
+"""
+Column-wise All-Around Score (AAS) scoring shared by the projection scripts.
+"""
+from __future__ import annotations
+
+import pandas as pd
+
+from .scoring import compile_scoring_systems
+from .team_index import TEAM_INDEX
+
+AAS_SCORING = compile_scoring_systems(["aas"])
+DEFAULT_OPPONENT_WIN_PCT = 0.5
+
+
+def calculate_aas(df: pd.DataFrame) -> pd.Series:
+    """
+    Calculates the All-Around Score (AAS) for every game in a DataFrame in a single pass.
+    The weights and double-double/triple-double bonus are defined in data/scoring_systems.json.
+    """
+    return AAS_SCORING.score(df)["AAS"]
+
+
+def parse_opponents(matchups: pd.Series) -> pd.Series:
+    """
+    Extracts the current-franchise opponent abbreviation from MATCHUP strings ("OKC vs. MEM", "OKC @ MEM").
+    """
+    opponents = matchups.str.extract(r"(?: vs\. | @ )(\S+)\s*$", expand=False).fillna("")
+    return opponents.map(TEAM_INDEX.canonical_abbreviations()).fillna(opponents)
+
+
+def add_opponent_adjusted_aas(df: pd.DataFrame, win_pct_table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds OPPONENT, OPPONENT_WIN_PCT and OPP_ADJ_AAS columns for every game via one
+    merge against a (SEASON, OPPONENT) win-percentage table.
+    Opponents missing from the table are treated as .500 teams.
+    """
+    df = df.drop(columns=["OPPONENT", "OPPONENT_WIN_PCT", "OPP_ADJ_AAS"], errors="ignore")
+    df["OPPONENT"] = parse_opponents(df["MATCHUP"])
+    merged = df.merge(win_pct_table[["SEASON", "OPPONENT", "OPPONENT_WIN_PCT"]], on=["SEASON", "OPPONENT"], how="left")
+    merged.index = df.index
+    merged["OPPONENT_WIN_PCT"] = merged["OPPONENT_WIN_PCT"].astype(float).fillna(DEFAULT_OPPONENT_WIN_PCT)
+    merged["OPP_ADJ_AAS"] = merged["AAS"] * merged["OPPONENT_WIN_PCT"]
+    return merged
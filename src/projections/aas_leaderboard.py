@@ -0,0 +1,133 @@
+"""
+League-wide AAS leaderboard built from one bulk game-log pull per season.
+
+Computes the same profile as calculate_l10_aas.py (baseline, consistency,
+L10/L30/L50, home/away, back-to-back and composite) plus 3-in-4 / 4-in-6
+splits and the Projected_* stat lines for every active player with groupby
+aggregations, and writes a single ranked table.
+
+Usage:
+    python -m src.projections.aas_leaderboard --seasons 3 --min-games 20
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .aas import add_opponent_adjusted_aas, calculate_aas
+from .nba_api_client import fetch_league_game_logs
+from .schedule import add_schedule_flags, load_schedule
+from .standings import get_last_n_seasons, get_standings_cache, get_win_percentage_table
+from .stat_projections import DEFAULT_WINDOW_WEIGHTS, parse_window_weights, project_stats
+
+TREND_WINDOWS = (10, 30, 50)
+
+
+def _window_mean(df: pd.DataFrame, column: str, n: int) -> pd.Series:
+    """
+    Mean of `column` over each player's last n games; NaN for players with fewer than n games.
+    """
+    recent = df[df['GAME_NUMBER'] < n]
+    grouped = recent.groupby('PLAYER_ID')[column]
+    return grouped.mean().where(grouped.size() >= n)
+
+
+def build_leaderboard(
+    game_logs: pd.DataFrame,
+    win_pct_table: Optional[pd.DataFrame] = None,
+    min_games: int = 1,
+    opponent_window: int = 10,
+    projection_weights: Optional[Dict[Optional[int], float]] = None,
+    schedule: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Builds the ranked AAS profile of every player in a stacked league game log.
+    `schedule` is the player-game schedule table (see schedule.py) to join instead of deriving the flags.
+    """
+    if game_logs.empty:
+        return pd.DataFrame()
+
+    df = game_logs.copy()
+    df['AAS'] = calculate_aas(df)
+    df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'])
+    df = df.sort_values(['PLAYER_ID', 'GAME_DATE'], ascending=[True, False], ignore_index=True)
+    df['GAME_NUMBER'] = df.groupby('PLAYER_ID').cumcount()
+    df = add_schedule_flags(df, schedule, 'PLAYER_ID')
+    df['IS_HOME'] = df['MATCHUP'].str.contains('vs.', regex=False)
+
+    if win_pct_table is None:
+        win_pct_table = pd.DataFrame(columns=["SEASON", "OPPONENT", "OPPONENT_WIN_PCT"])
+    df = add_opponent_adjusted_aas(df, win_pct_table)
+
+    by_player = df.groupby('PLAYER_ID')
+    board = pd.DataFrame({
+        'Player': by_player['PLAYER_NAME'].first(),
+        'Team': by_player['TEAM_ABBREVIATION'].first(),
+        'Games': by_player.size(),
+        'Baseline_AAS': by_player['AAS'].mean(),
+        'AAS_Std_Dev': by_player['AAS'].std(),
+    })
+    for n in TREND_WINDOWS:
+        board[f'L{n}_AAS'] = _window_mean(df, 'AAS', n)
+    board['Home_AAS'] = df[df['IS_HOME']].groupby('PLAYER_ID')['AAS'].mean()
+    board['Away_AAS'] = df[~df['IS_HOME']].groupby('PLAYER_ID')['AAS'].mean()
+    board['B2B_AAS'] = df[df['IS_B2B']].groupby('PLAYER_ID')['AAS'].mean()
+    board['Three_In_Four_AAS'] = df[df['IS_3_IN_4']].groupby('PLAYER_ID')['AAS'].mean()
+    board['Four_In_Six_AAS'] = df[df['IS_4_IN_6']].groupby('PLAYER_ID')['AAS'].mean()
+
+    recent_opponent_adjusted_aas = df[df['GAME_NUMBER'] < opponent_window].groupby('PLAYER_ID')['OPP_ADJ_AAS'].mean()
+    l10_aas = board['L10_AAS'].fillna(board['Baseline_AAS'])
+    board['Composite_Predictive_AAS'] = (
+        board['Baseline_AAS'] * 0.4 + l10_aas * 0.4 + recent_opponent_adjusted_aas * 0.2
+    )
+    board = board.join(project_stats(df, projection_weights))
+
+    board = board[board['Games'] >= min_games]
+    board = board.sort_values('Composite_Predictive_AAS', ascending=False).reset_index()
+    board.insert(0, 'Rank', np.arange(1, len(board) + 1))
+    return board
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank every active NBA player by AAS from league-wide game logs.")
+    parser.add_argument("--seasons", type=int, default=3, help="The number of past seasons to analyze.")
+    parser.add_argument("--min-games", type=int, default=10, help="Minimum games played to be ranked.")
+    parser.add_argument("--opponent-window", type=int, default=10, help="Number of recent games of opponent-adjusted AAS used in the composite score.")
+    parser.add_argument("--standings-ttl", type=float, default=12.0, help="Hours before cached current-season standings are refetched.")
+    parser.add_argument("--projection-weights", type=parse_window_weights, default=DEFAULT_WINDOW_WEIGHTS, help="Window weights for the Projected_* stats, e.g. 'all:0.5,10:0.5'.")
+    parser.add_argument("--output", help="Path of the leaderboard CSV (defaults to a timestamped file in outputs/).")
+    args = parser.parse_args()
+    get_standings_cache(args.standings_ttl)
+
+    seasons = get_last_n_seasons(args.seasons)
+    print(f"Fetching league game logs for: {', '.join(seasons)}")
+    game_logs = fetch_league_game_logs(seasons)
+    if game_logs.empty:
+        raise SystemExit("No league game logs returned.")
+
+    # Only players who have appeared in the most recent season on record are ranked
+    latest_season = next(season for season in seasons if season in set(game_logs['SEASON']))
+    active_ids = game_logs.loc[game_logs['SEASON'] == latest_season, 'PLAYER_ID'].unique()
+    game_logs = game_logs[game_logs['PLAYER_ID'].isin(active_ids)]
+
+    win_pct_table = get_win_percentage_table(seasons)
+    schedule = load_schedule()
+    if schedule is None:
+        print("No player-game schedule table (python -m src.projections.schedule); deriving schedule flags from the game logs.")
+    leaderboard = build_leaderboard(game_logs, win_pct_table, args.min_games, args.opponent_window, args.projection_weights, schedule)
+
+    output_file = args.output or f"outputs/aas_leaderboard_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv"
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    leaderboard.to_csv(output_file, index=False)
+
+    print(leaderboard.head(25).to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+    print(f"\nRanked {len(leaderboard)} players; leaderboard saved to {output_file}")
+
+
+if __name__ == "__main__":
+    main()
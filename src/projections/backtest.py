@@ -0,0 +1,72 @@
+"""
+Walk-forward backtest of the player_game projection over full game histories.
+
+Each game log (checklist schema, see data/game_logs/lebron_james.csv) is
+loaded in full, features are engineered once (or read from the persistent
+feature cache when the log is unchanged), and every game in the optional
+date range is projected from the games before it. Per-player MAE, RMSE and
+mean minutes error are printed, and the per-game rows can be written to CSV.
+
+Usage:
+    python -m src.projections.backtest data/game_logs/*.csv
+    python -m src.projections.backtest data/game_logs/lebron_james.csv --start 2023-12-15 --output outputs/backtest.csv
+    python -m src.projections.backtest data/game_logs/*.csv --params data/calibration/projection_params.json
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .calibrate import load_calibrated_params
+from .feature_cache import FeatureCache, load_many_features, report_skipped
+from .player_game import DEFAULT_PARAMS, ProjectionParams, backtest_metrics, walk_forward_backtest, write_csv
+
+
+def backtest_players(
+    paths: List[Path | str],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    params: ProjectionParams = DEFAULT_PARAMS,
+    cache: Optional[FeatureCache] = None,
+) -> Dict[str, List[Dict[str, float]]]:
+    """
+    Walk-forward backtests every game log; keyed by player id (the file stem).
+    Files that are not in the checklist schema are reported and skipped.
+    """
+    results: Dict[str, List[Dict[str, float]]] = {}
+    for player_id, features in load_many_features(paths, None, cache, on_error=report_skipped).items():
+        results[player_id] = [{"player_id": player_id, **row} for row in walk_forward_backtest(features, start, end, params=params)]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk-forward backtest of the player_game projection.")
+    parser.add_argument("game_logs", nargs="+", help="Checklist-schema game log CSVs, one per player.")
+    parser.add_argument("--start", help="First game date to evaluate (YYYY-MM-DD).")
+    parser.add_argument("--end", help="Last game date to evaluate (YYYY-MM-DD).")
+    parser.add_argument("--output", help="Optional CSV path for the per-game backtest rows.")
+    parser.add_argument("--params", help="Calibrated parameter JSON (from src.projections.calibrate) instead of the defaults.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-engineer features instead of using the feature cache.")
+    args = parser.parse_args()
+
+    params = load_calibrated_params(args.params) if args.params else DEFAULT_PARAMS
+    cache = None if args.no_cache else FeatureCache()
+    results = backtest_players(args.game_logs, args.start, args.end, params, cache)
+
+    print(f"{'player':<30} {'games':>6} {'MAE':>8} {'RMSE':>8} {'min err':>8}")
+    for player_id, rows in results.items():
+        metrics = backtest_metrics(rows)
+        print(f"{player_id:<30} {metrics['games']:>6} {metrics['mae']:>8.2f} {metrics['rmse']:>8.2f} {metrics['mean_minutes_error']:>8.2f}")
+    all_rows = [row for rows in results.values() for row in rows]
+    if len(results) > 1:
+        metrics = backtest_metrics(all_rows)
+        print(f"{'all players':<30} {metrics['games']:>6} {metrics['mae']:>8.2f} {metrics['rmse']:>8.2f} {metrics['mean_minutes_error']:>8.2f}")
+
+    if args.output and all_rows:
+        write_csv(args.output, all_rows, list(all_rows[0].keys()))
+        print(f"\nBacktest rows saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
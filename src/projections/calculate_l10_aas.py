@@ -1,91 +1,30 @@
-from nba_api.stats.static import players, teams
-from nba_api.stats.endpoints import playergamelog, leaguestandings
 import pandas as pd
 import argparse
-from datetime import datetime, timedelta
 import os
 
+from .aas import add_opponent_adjusted_aas, calculate_aas
+from .instrumentation import INSTRUMENTATION, stage
+from .standings import get_last_n_seasons, get_standings_cache, get_win_percentage_table
+from .nba_api_client import fetch_player_game_logs
+from .player_index import get_player_index
+from .rolling_form import TREND_WINDOWS, get_rolling_form_store
+from .schedule import add_schedule_flags, load_schedule
+
 def get_player_id(player_name):
     """
     Gets the player ID for a given player name.
     """
-    player = players.find_players_by_full_name(player_name)
-    if not player:
+    player = get_player_index().resolve(player_name, active_only=False)
+    if player is None:
         return None
-    return player[0]['id']
+    return player.id
 
-def get_last_n_seasons(n):
-    """
-    Gets a list of the last n season strings.
-    """
-    now = datetime.now()
-    current_year = now.year
-    if now.month < 10:
-        current_year -= 1
-    
-    seasons = []
-    for i in range(n):
-        start_year = current_year - i
-        end_year = (start_year + 1) % 100
-        seasons.append(f"{start_year}-{end_year:02d}")
-    return seasons
-
-def get_player_game_log(player_id, seasons):
+def get_player_game_log(player_id, seasons, max_workers=4):
     """
     Gets the game log for a given player ID and a list of seasons.
+    Seasons are fetched concurrently under the shared nba_api rate limit.
     """
-    all_games = []
-    for season in seasons:
-        gamelog = playergamelog.PlayerGameLog(player_id=player_id, season=season)
-        df = gamelog.get_data_frames()[0]
-        df['SEASON'] = season
-        all_games.append(df)
-    
-    if not all_games:
-        return pd.DataFrame()
-        
-    return pd.concat(all_games, ignore_index=True)
-
-def get_team_win_percentages(seasons):
-    """
-    Gets the win percentages for all teams for a list of seasons.
-    """
-    win_percentages = {}
-    for season in seasons:
-        standings = leaguestandings.LeagueStandings(season=season).get_data_frames()[0]
-        season_percentages = {}
-        for index, row in standings.iterrows():
-            team_id = row['TeamID']
-            team_abbreviation = teams.find_team_name_by_id(team_id)['abbreviation']
-            season_percentages[team_abbreviation] = row['WinPCT']
-        win_percentages[season] = season_percentages
-    return win_percentages
-
-def calculate_aas(stats):
-    """
-    Calculates the All-Around Score (AAS) for a single game.
-    """
-    aas = 0
-    aas += stats["PTS"] * 1
-    aas += stats["REB"] * 1.2
-    aas += stats["AST"] * 1.5
-    aas += stats["BLK"] * 3
-    aas += stats["STL"] * 3
-    aas += stats["TOV"] * -2
-    aas += stats["FG3M"] * 1
-
-    # Check for double-double and triple-double
-    double_digit_stats = 0
-    for stat in ["PTS", "REB", "AST", "STL", "BLK"]:
-        if stats[stat] >= 10:
-            double_digit_stats += 1
-    
-    if double_digit_stats >= 2:
-        aas += 1
-    if double_digit_stats >= 3:
-        aas += 1 # An additional point for a triple-double
-
-    return aas
+    return fetch_player_game_logs(player_id, seasons, max_workers=max_workers)
 
 def calculate_baseline_stats(df):
     """
@@ -94,18 +33,25 @@ def calculate_baseline_stats(df):
     if df.empty:
         return 0, 0, pd.DataFrame()
         
-    df['AAS'] = df.apply(calculate_aas, axis=1)
+    df['AAS'] = calculate_aas(df)
     baseline_aas = df['AAS'].mean()
     std_dev_aas = df['AAS'].std()
     return baseline_aas, std_dev_aas, df
 
-def calculate_short_term_trends(df):
+def calculate_short_term_trends(df, player_id=None):
     """
     Calculates the L10, L30, and L50 AAS from a DataFrame of games.
+    Windows held by the rolling form store, when it is current through the player's latest game,
+    are read from it instead of being recomputed.
     """
+    stored = {}
+    if player_id is not None and not df.empty:
+        stored = get_rolling_form_store().trends_through(player_id, pd.to_datetime(df['GAME_DATE']).max())
     trends = {}
-    for n in [10, 30, 50]:
-        if len(df) >= n:
+    for n in TREND_WINDOWS:
+        if stored.get(f"L{n}") is not None:
+            trends[f"L{n}"] = stored[f"L{n}"]
+        elif len(df) >= n:
             trends[f"L{n}"] = df.head(n)['AAS'].mean()
         else:
             trends[f"L{n}"] = None
@@ -113,25 +59,48 @@ def calculate_short_term_trends(df):
 
 def identify_back_to_backs(df):
     """
-    Identifies back-to-back games in a game log.
+    Identifies back-to-back games in a game log, along with the other schedule-density flags.
+    Flags are joined from the player-game schedule table when it has been built.
     """
     df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'])
-    df = df.sort_values(by='GAME_DATE', ascending=False)
-    df['IS_B2B'] = df['GAME_DATE'].diff(-1) == timedelta(days=1)
-    return df
+    df = add_schedule_flags(df, load_schedule())
+    return df.sort_values(by='GAME_DATE', ascending=False)
 
 def main():
     parser = argparse.ArgumentParser(description="Calculate advanced stats for a given NBA player based on historical data.")
     parser.add_argument("player_name", nargs="?", default="Donte DiVincenzo", help="The name of the player to analyze.")
     parser.add_argument("--seasons", type=int, default=3, help="The number of past seasons to analyze.")
+    parser.add_argument("--opponent-window", type=int, default=10, help="Number of recent games of opponent-adjusted AAS used in the composite score.")
+    parser.add_argument("--standings-ttl", type=float, default=12.0, help="Hours before cached current-season standings are refetched.")
     parser.add_argument("--output", help="The path to the CSV file to save the results to.") # Re-added output argument
+    parser.add_argument("--workers", type=int, default=4, help="Maximum number of seasons to fetch concurrently.")
+    parser.add_argument("--profile", action="store_true", help="Record per-stage timings and API usage and print a summary.")
+    parser.add_argument("--profile-json", help="Also write the profile records to this JSON file (implies --profile).")
     args = parser.parse_args()
+    get_standings_cache(args.standings_ttl)
+    if args.profile or args.profile_json:
+        INSTRUMENTATION.enable()
 
+    try:
+        analyze_player(args)
+    finally:
+        if INSTRUMENTATION.enabled:
+            print("\n" + INSTRUMENTATION.report())
+            if args.profile_json:
+                INSTRUMENTATION.write_json(args.profile_json)
+                print(f"Profile written to {args.profile_json}")
+
+def analyze_player(args):
+    """
+    Runs the full single-player analysis for the parsed command-line arguments.
+    """
     player_name = args.player_name
     num_seasons = args.seasons
+    opponent_window = args.opponent_window
     output_file = args.output # Get output file from args
     
-    player_id = get_player_id(player_name)
+    with stage("resolve"):
+        player_id = get_player_id(player_name)
 
     if not player_id:
         print(f"Could not find player ID for {player_name}")
@@ -140,16 +109,21 @@ def main():
     seasons_to_fetch = get_last_n_seasons(num_seasons)
     print(f"Fetching data for {player_name} for the following seasons: {', '.join(seasons_to_fetch)}")
     
-    game_log_df = get_player_game_log(player_id, seasons_to_fetch)
+    with stage("game_logs"):
+        game_log_df = get_player_game_log(player_id, seasons_to_fetch, max_workers=args.workers)
+        INSTRUMENTATION.add_rows(len(game_log_df))
     if game_log_df.empty:
         print(f"No games found for {player_name} in the specified seasons.")
         return
 
-    team_win_percentages = get_team_win_percentages(seasons_to_fetch)
+    with stage("standings"):
+        win_pct_table = get_win_percentage_table(seasons_to_fetch)
 
-    baseline_aas, std_dev_aas, game_log_df_with_aas = calculate_baseline_stats(game_log_df)
-    trends = calculate_short_term_trends(game_log_df_with_aas)
-    game_log_df_with_aas = identify_back_to_backs(game_log_df_with_aas)
+    with stage("aas", rows=len(game_log_df)):
+        baseline_aas, std_dev_aas, game_log_df_with_aas = calculate_baseline_stats(game_log_df)
+        trends = calculate_short_term_trends(game_log_df_with_aas, player_id)
+        game_log_df_with_aas = identify_back_to_backs(game_log_df_with_aas)
+        game_log_df_with_aas = add_opponent_adjusted_aas(game_log_df_with_aas, win_pct_table)
 
     home_games = game_log_df_with_aas[game_log_df_with_aas['MATCHUP'].str.contains('vs.')]
     away_games = game_log_df_with_aas[game_log_df_with_aas['MATCHUP'].str.contains('@')]
@@ -175,31 +149,17 @@ def main():
     print(f"Away AAS: {away_aas:.2f}")
     print(f"Back-to-Back AAS: {b2b_aas:.2f}")
 
-    print(f"\n--- Opponent-Adjusted AAS (Last 10 Games) ---")
-    last_10_games = game_log_df_with_aas.head(10)
-    opponent_adjusted_aas_list = []
-    for index, game in last_10_games.iterrows():
-        matchup = game['MATCHUP']
-        if " vs. " in matchup:
-            opponent_abbr = matchup.split(" vs. ")[1]
-        elif " @ " in matchup:
-            opponent_abbr = matchup.split(" @ ")[1]
-        else:
-            opponent_abbr = ""
-
-        game_season = game['SEASON']
-        opponent_win_pct = team_win_percentages.get(game_season, {}).get(opponent_abbr, 0.5)
-        
-        opponent_adjusted_aas = game['AAS'] * opponent_win_pct
-        opponent_adjusted_aas_list.append(opponent_adjusted_aas)
-
-        print(f"Date: {game['GAME_DATE'].date()}, Opp: {opponent_abbr} (Win %: {opponent_win_pct:.3f}), Opponent-Adjusted AAS: {opponent_adjusted_aas:.2f}")
+    print(f"\n--- Opponent-Adjusted AAS (Last {opponent_window} Games) ---")
+    recent_games = game_log_df_with_aas.head(opponent_window)
+    for index, game in recent_games.iterrows():
+        print(f"Date: {game['GAME_DATE'].date()}, Opp: {game['OPPONENT']} (Win %: {game['OPPONENT_WIN_PCT']:.3f}), Opponent-Adjusted AAS: {game['OPP_ADJ_AAS']:.2f}")
 
     # Composite Score
     l10_aas = trends.get('L10', baseline_aas)
-    l10_opponent_adjusted_aas = sum(opponent_adjusted_aas_list) / len(opponent_adjusted_aas_list) if opponent_adjusted_aas_list else 0
+    opponent_adjusted_window = recent_games['OPP_ADJ_AAS']
+    recent_opponent_adjusted_aas = opponent_adjusted_window.mean() if not opponent_adjusted_window.empty else 0
     
-    composite_score = (baseline_aas * 0.4) + (l10_aas * 0.4) + (l10_opponent_adjusted_aas * 0.2)
+    composite_score = (baseline_aas * 0.4) + (l10_aas * 0.4) + (recent_opponent_adjusted_aas * 0.2)
     print(f"\n--- Composite Score ---")
     print(f"Predictive AAS: {composite_score:.2f}")
 
@@ -217,9 +177,10 @@ def main():
             "B2B_AAS": b2b_aas,
             "Composite_Predictive_AAS": composite_score
         }
-        results_df = pd.DataFrame([results_to_save])
-        file_exists = os.path.isfile(output_file)
-        results_df.to_csv(output_file, mode='a', header=not file_exists, index=False)
+        with stage("write", rows=1):
+            results_df = pd.DataFrame([results_to_save])
+            file_exists = os.path.isfile(output_file)
+            results_df.to_csv(output_file, mode='a', header=not file_exists, index=False)
         print(f"\nResults saved to {output_file}")
 
 
@@ -0,0 +1,217 @@
+"""
+Grid-search calibration of the player_game projection blend.
+
+The blend weights (prior / minutes-usage / efficiency), the Vegas total factor
+and the injury minutes modifiers in ProjectionParams were hand-tuned. This
+command walk-forward backtests every tracked player's game log, keeps the
+resulting project_columns inputs as one set of flat arrays, and scores every
+parameter combination in the grid against them. Evaluation is fanned out over
+a process pool: the arrays are handed to each worker once through the pool
+initializer (inherited copy-on-write where processes are forked) and each task
+only carries a chunk of parameter sets. The best set and its error metrics,
+next to the hand-tuned baseline, are written as JSON.
+
+Injury modifiers only matter for games with an injury status; when no game
+log carries an injury_status column their grid axes are pinned to the
+defaults instead of multiplying the grid for no effect.
+
+Usage:
+    python -m src.projections.calibrate data/game_logs/*.csv
+    python -m src.projections.calibrate data/game_logs/*.csv --metric rmse --workers 16 --grid vegas_factor=0,0.05,0.1
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .feature_cache import FeatureCache, load_many_features, report_skipped
+from .player_game import (
+    CONTEXT_FIELDS,
+    DEFAULT_PARAMS,
+    PROJECTION_FEATURES,
+    ProjectionParams,
+    error_metrics,
+    project_columns,
+    walk_forward_inputs,
+)
+
+CALIBRATION_PATH = Path(__file__).resolve().parents[2] / "data" / "calibration" / "projection_params.json"
+METRICS = ("mae", "rmse")
+INJURY_PARAMS = ("questionable_modifier", "probable_modifier", "out_modifier")
+DEFAULT_GRID: Dict[str, Tuple[float, ...]] = {
+    "prior_weight": (0.30, 0.35, 0.40, 0.45, 0.50, 0.55, 0.60),
+    "minutes_usage_weight": (0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50),
+    "efficiency_weight": (0.10, 0.15, 0.20, 0.25, 0.30),
+    "vegas_factor": (0.0, 0.05, 0.1, 0.15, 0.2),
+    "questionable_modifier": (0.85, 0.88, 0.92, 0.95, 1.0),
+    "probable_modifier": (0.94, 0.97, 1.0),
+    "out_modifier": (0.0,),
+}
+
+# Read-only calibration arrays, set once per worker process by _init_worker
+_DATA: Dict[str, np.ndarray] = {}
+
+
+def load_calibration_data(
+    paths: Sequence[Path | str],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    cache: Optional[FeatureCache] = None,
+) -> Tuple[Dict[str, np.ndarray], int]:
+    """
+    Walk-forward inputs and actuals of every game log, concatenated into flat arrays
+    (latest:<feature>, context:<field>, injury_status, actual_score, actual_minutes),
+    and the number of players with backtestable games.
+    Files that are not in the checklist schema are reported and skipped.
+    """
+    parts: Dict[str, List[np.ndarray]] = {}
+    players = 0
+    for features in load_many_features(paths, None, cache, on_error=report_skipped).values():
+        indices, latest, context, injury_statuses = walk_forward_inputs(features, start, end)
+        if not indices:
+            continue
+        players += 1
+        columns = {f"latest:{key}": latest.get(key, np.full(len(indices), np.nan)) for key in PROJECTION_FEATURES}
+        columns.update({f"context:{key}": context.get(key, np.full(len(indices), np.nan)) for key in CONTEXT_FIELDS})
+        columns["injury_status"] = np.array(injury_statuses, dtype=object)
+        columns["actual_score"] = features.column("sorare_score")[indices].astype(float)
+        columns["actual_minutes"] = features.column("minutes")[indices].astype(float)
+        for key, values in columns.items():
+            parts.setdefault(key, []).append(values)
+
+    return {key: np.concatenate(values) for key, values in parts.items()}, players
+
+
+def evaluate(data: Dict[str, np.ndarray], params: ProjectionParams) -> Dict[str, float]:
+    """Backtest error metrics of one parameter set over the calibration arrays."""
+    n = len(data["actual_score"])
+    latest = {key: data[f"latest:{key}"] for key in PROJECTION_FEATURES}
+    context = {key: data[f"context:{key}"] for key in CONTEXT_FIELDS}
+    projections = project_columns(latest, context, [""] * n, list(data["injury_status"]), params, with_notes=False)
+    return error_metrics(
+        projections["expected_score"] - data["actual_score"],
+        projections["expected_minutes"] - data["actual_minutes"],
+    )
+
+
+def _init_worker(data: Dict[str, np.ndarray]) -> None:
+    global _DATA
+    _DATA = data
+
+
+def _evaluate_chunk(chunk: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    return [evaluate(_DATA, ProjectionParams(**values)) for values in chunk]
+
+
+def parameter_grid(grid: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Every combination of the grid's values, as ProjectionParams keyword dicts."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def parse_grid_overrides(specs: Sequence[str]) -> Dict[str, Tuple[float, ...]]:
+    """
+    Parses ["vegas_factor=0,0.05,0.1"] into {"vegas_factor": (0.0, 0.05, 0.1)}.
+    """
+    names = {field.name for field in fields(ProjectionParams)}
+    overrides: Dict[str, Tuple[float, ...]] = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in names or not values:
+            raise ValueError(f"Expected <param>=<v1>,<v2>,... with param in {sorted(names)}, got '{spec}'.")
+        overrides[name] = tuple(float(value) for value in values.split(","))
+    return overrides
+
+
+def calibrate(
+    data: Dict[str, np.ndarray],
+    grid: Dict[str, Sequence[float]],
+    metric: str = "mae",
+    workers: Optional[int] = None,
+    top: int = 10,
+) -> List[Tuple[Dict[str, float], Dict[str, float]]]:
+    """
+    Scores every parameter set in the grid and returns the `top` best (params, metrics) pairs by `metric`.
+    """
+    candidates = parameter_grid(grid)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [evaluate(data, ProjectionParams(**values)) for values in candidates]
+    else:
+        chunk_size = max(1, len(candidates) // (workers * 8))
+        chunks = [candidates[start:start + chunk_size] for start in range(0, len(candidates), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,)) as executor:
+            results = [metrics for chunk in executor.map(_evaluate_chunk, chunks) for metrics in chunk]
+
+    ranked = sorted(zip(candidates, results), key=lambda pair: np.nan_to_num(pair[1][metric], nan=np.inf))
+    return ranked[:top]
+
+
+def load_calibrated_params(path: Path | str = CALIBRATION_PATH) -> ProjectionParams:
+    """
+    Reads the best parameter set written by main().
+    """
+    with open(path) as f:
+        return ProjectionParams(**json.load(f)["params"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the player_game projection blend against walk-forward backtests.")
+    parser.add_argument("game_logs", nargs="+", help="Checklist-schema game log CSVs of every tracked player.")
+    parser.add_argument("--start", help="First game date to evaluate (YYYY-MM-DD).")
+    parser.add_argument("--end", help="Last game date to evaluate (YYYY-MM-DD).")
+    parser.add_argument("--metric", choices=METRICS, default="mae", help="Error metric to minimise.")
+    parser.add_argument("--grid", action="append", default=[], help="Override one grid axis, e.g. vegas_factor=0,0.05,0.1; repeatable.")
+    parser.add_argument("--workers", type=int, help="Worker processes (defaults to the CPU count; 1 runs in-process).")
+    parser.add_argument("--output", default=str(CALIBRATION_PATH), help="JSON path for the best parameters and metrics.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-engineer features instead of using the feature cache.")
+    args = parser.parse_args()
+
+    data, players = load_calibration_data(args.game_logs, args.start, args.end, None if args.no_cache else FeatureCache())
+    if not len(data.get("actual_score", ())):
+        raise SystemExit("No backtestable games in the given game logs.")
+
+    grid = {**DEFAULT_GRID, **parse_grid_overrides(args.grid)}
+    if all(status == "Healthy" for status in data["injury_status"]):
+        print("No injury statuses in the game logs; injury modifiers are kept at their defaults.")
+        grid.update({name: (getattr(DEFAULT_PARAMS, name),) for name in INJURY_PARAMS})
+
+    candidates = len(parameter_grid(grid))
+    print(f"Evaluating {candidates:,} parameter sets over {len(data['actual_score']):,} games from {players} players...")
+    ranked = calibrate(data, grid, args.metric, args.workers)
+    best_params, best_metrics = ranked[0]
+    baseline = evaluate(data, DEFAULT_PARAMS)
+
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "metric": args.metric,
+        "players": players,
+        "grid_size": candidates,
+        "params": best_params,
+        "metrics": best_metrics,
+        "baseline": {"params": DEFAULT_PARAMS.to_dict(), "metrics": baseline},
+        "top": [{"params": params, "metrics": metrics} for params, metrics in ranked],
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w") as f:
+        json.dump(payload, f, indent=2)
+
+    print(f"{'':<10} {'games':>6} {'MAE':>8} {'RMSE':>8} {'min err':>8}")
+    for label, metrics in (("baseline", baseline), ("best", best_metrics)):
+        print(f"{label:<10} {metrics['games']:>6} {metrics['mae']:>8.3f} {metrics['rmse']:>8.3f} {metrics['mean_minutes_error']:>8.2f}")
+    print("Best parameters: " + ", ".join(f"{name}={value:g}" for name, value in best_params.items()))
+    print(f"Saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
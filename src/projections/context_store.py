@@ -0,0 +1,169 @@
+"""
+Indexed store over data/upcoming_game_context.csv.
+
+The context file accumulates timestamped snapshots (injury news, projected
+minutes, lines) for every player on a slate. The store indexes it once into
+a latest-row-per-player_id map, optionally keeping each player's full history,
+and afterwards only reads bytes appended since the previous refresh. Point
+lookups and slate-wide fetches are dictionary reads.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+CONTEXT_FLOAT_FIELDS = ("projected_minutes", "pace_context", "vegas_total", "opponent_def_rating")
+_FINGERPRINT_WINDOW = 4096
+
+
+def _convert(row: Dict[str, str]) -> Dict[str, str | float]:
+    for key in CONTEXT_FLOAT_FIELDS:
+        if key in row and row[key] != "":
+            row[key] = float(row[key])
+    return row
+
+
+class UpcomingContextStore:
+    """
+    Latest context row per player_id (the last one in file order), plus optional history.
+    """
+
+    def __init__(self, path: Path | str, keep_history: bool = False):
+        self.path = Path(path)
+        self.keep_history = keep_history
+        self._latest: Dict[str, Dict[str, str | float]] = {}
+        self._history: Dict[str, List[Dict[str, str | float]]] = defaultdict(list)
+        self._fieldnames: Optional[List[str]] = None
+        self._header_size = 0
+        self._offset = 0
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def _reset(self) -> None:
+        self._latest.clear()
+        self._history.clear()
+        self._fieldnames = None
+        self._header_size = 0
+        self._offset = 0
+        self._fingerprint = None
+
+    def _prefix_fingerprint(self, f) -> str:
+        """Hash of the header and the bytes just before the indexed offset."""
+        digest = hashlib.sha256()
+        f.seek(0)
+        digest.update(f.read(self._header_size))
+        start = max(self._header_size, self._offset - _FINGERPRINT_WINDOW)
+        f.seek(start)
+        digest.update(f.read(self._offset - start))
+        return digest.hexdigest()
+
+    def refresh(self) -> None:
+        """
+        Indexes rows appended since the last refresh. A file that shrank or whose indexed
+        prefix changed (a regenerated snapshot rather than an append) is reindexed from scratch.
+        """
+        with self._lock:
+            if not self.path.exists():
+                self._reset()
+                return
+            with self.path.open("rb") as f:
+                if self._fieldnames is not None and (
+                    self.path.stat().st_size < self._offset or self._prefix_fingerprint(f) != self._fingerprint
+                ):
+                    self._reset()
+                if self._fieldnames is None:
+                    f.seek(0)
+                    header = f.readline()
+                    self._fieldnames = next(csv.reader([header.decode("utf-8-sig")]), [])
+                    self._header_size = self._offset = len(header)
+                f.seek(self._offset)
+                data = f.read()
+                # An unterminated last line is served as latest but re-read (and added to history) once complete
+                end = data.rfind(b"\n") + 1
+                self._offset += end
+                self._fingerprint = self._prefix_fingerprint(f)
+            for values in csv.reader(io.StringIO(data[:end].decode("utf-8"))):
+                if values:
+                    self._index(_convert(dict(zip(self._fieldnames, values))))
+            for values in csv.reader([data[end:].decode("utf-8")]):
+                if values:
+                    row = _convert(dict(zip(self._fieldnames, values)))
+                    self._latest[row.get("player_id")] = row
+
+    def _index(self, row: Dict[str, str | float]) -> None:
+        player_id = row.get("player_id")
+        self._latest[player_id] = row
+        if self.keep_history:
+            self._history[player_id].append(row)
+
+    def get(self, player_id: str) -> Optional[Dict[str, str | float]]:
+        """
+        The player's latest context row, or None.
+        """
+        row = self._latest.get(player_id)
+        return dict(row) if row is not None else None
+
+    def bulk(self, player_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, str | float]]:
+        """
+        Latest rows for the given players (every indexed player when None); unknown ids are omitted.
+        """
+        if player_ids is None:
+            player_ids = list(self._latest)
+        return {player_id: dict(self._latest[player_id]) for player_id in player_ids if player_id in self._latest}
+
+    def history(self, player_id: str, since: Optional[str] = None) -> List[Dict[str, str | float]]:
+        """
+        The player's snapshots ordered by timestamp, optionally from an ISO timestamp onward.
+        """
+        if not self.keep_history:
+            raise ValueError("Context history is only kept when the store is created with keep_history=True.")
+        rows = sorted(self._history.get(player_id, []), key=lambda row: row.get("timestamp") or "")
+        if since is not None:
+            rows = [row for row in rows if (row.get("timestamp") or "") >= since]
+        return [dict(row) for row in rows]
+
+    def append(self, rows: List[Dict[str, str | float]]) -> None:
+        """
+        Appends context snapshots to the file and indexes them.
+        """
+        if not rows:
+            return
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        fieldnames = list(rows[0].keys()) if new_file else self._fieldnames
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not new_file:
+            with self.path.open("rb") as f:
+                f.seek(-1, 2)
+                missing_newline = f.read(1) not in (b"\n", b"\r")
+        with self.path.open("a", newline="") as f:
+            if not new_file and missing_newline:
+                f.write("\r\n")
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            if new_file:
+                writer.writeheader()
+            writer.writerows(rows)
+        self.refresh()
+
+
+_stores: Dict[Path, UpcomingContextStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_context_store(path: Path | str) -> UpcomingContextStore:
+    """
+    Returns the process-wide store for a context file, refreshed with any appended rows.
+    """
+    path = Path(path).resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = UpcomingContextStore(path)
+            return store
+    store.refresh()
+    return store
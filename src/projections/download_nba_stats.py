@@ -1,23 +1,10 @@
 import argparse
 import os
-import time
 import pandas as pd
 from nba_api.stats.endpoints import playergamelog
 from nba_api.stats.static import players
-from requests.exceptions import ReadTimeout
 
-def make_api_request(api_call, max_retries=3, delay=5, **kwargs):
-    """
-    Makes an API request with a retry mechanism.
-    """
-    for attempt in range(max_retries):
-        try:
-            return api_call(**kwargs)
-        except ReadTimeout:
-            print(f"API call timed out. Retrying in {delay} seconds... (Attempt {attempt + 1}/{max_retries})")
-            time.sleep(delay)
-    print(f"API call failed after {max_retries} attempts.")
-    return None
+from .nba_api_client import make_api_request
 
 def get_all_player_game_logs(season):
     """
@@ -42,7 +29,6 @@ def get_all_player_game_logs(season):
                 player_game_log_df = gamelog.get_data_frames()[0]
                 if not player_game_log_df.empty:
                     all_game_logs = pd.concat([all_game_logs, player_game_log_df], ignore_index=True)
-            time.sleep(0.6) # Add a delay to avoid rate limiting
         except Exception as e:
             print(f"An error occurred for player {player_name}: {e}")
 
@@ -0,0 +1,196 @@
+"""
+Persistent cache of engineered features, keyed by game-log content.
+
+engineer_features output is stored under the content_key of the source CSV's
+SHA-256, FEATURE_CONFIG_VERSION, the rolling windows and the trailing-games
+cut, so editing or appending to a log (or changing the feature code and
+bumping the version) simply produces a new key. Each entry is a directory of
+one .npy file per numeric column plus a manifest; hits load the numeric
+columns memory-mapped, so re-running the notebook or a batch over dozens of
+unchanged players reads features instead of re-deriving them.
+
+Usage:
+    cache = FeatureCache()
+    features = load_features("data/game_logs/lebron_james.csv", trailing_games=None, cache=cache)
+    by_player = load_many_features(sorted(Path("data/game_logs").glob("*.csv")), cache=cache)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .player_game import (
+    FEATURE_CONFIG_VERSION,
+    ROLLING_WINDOWS,
+    FeatureFrame,
+    engineer_features,
+    load_game_logs,
+    load_many_game_logs,
+)
+from .result_cache import content_key
+
+FEATURE_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "features"
+
+# File digests memoised by (path, size, mtime_ns) so repeated loads in one process hash each log once
+_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(path: Path | str) -> str:
+    """
+    SHA-256 of a file's content.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _digests:
+        digest = hashlib.sha256()
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        _digests[memo_key] = digest.hexdigest()
+    return _digests[memo_key]
+
+
+def feature_key(path: Path | str, trailing_games: Optional[int] = None) -> str:
+    return content_key({
+        "game_log_sha256": file_digest(path),
+        "feature_config_version": FEATURE_CONFIG_VERSION,
+        "rolling_windows": ROLLING_WINDOWS,
+        "trailing_games": trailing_games,
+    })
+
+
+class FeatureCache:
+    """
+    One directory per key under FEATURE_CACHE_DIR, fanned out by key prefix.
+    """
+
+    def __init__(self, root: Path | str = FEATURE_CACHE_DIR):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> Optional[FeatureFrame]:
+        path = self._path(key)
+        manifest_path = path / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        with manifest_path.open() as f:
+            manifest = json.load(f)
+
+        columns: Dict[str, np.ndarray] = {}
+        for column in manifest["columns"]:
+            if column["kind"] == "array":
+                columns[column["name"]] = np.load(path / column["file"], mmap_mode="r")
+            elif column["kind"] == "datetime":
+                columns[column["name"]] = np.load(path / column["file"]).astype(object)
+            else:
+                columns[column["name"]] = np.array(column["values"], dtype=object)
+        return FeatureFrame(columns, manifest["warmup"])
+
+    def put(self, key: str, frame: FeatureFrame) -> bool:
+        """
+        Stores the frame; returns False (storing nothing) if a column holds values other than numbers, datetimes or strings.
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp_path.mkdir(parents=True, exist_ok=True)
+        try:
+            manifest_columns = []
+            for position, (name, values) in enumerate(frame.columns.items()):
+                entry = {"name": name}
+                if values.dtype != object:
+                    entry.update(kind="array", file=f"{position}.npy")
+                    np.save(tmp_path / entry["file"], values)
+                elif all(value is None or (isinstance(value, datetime) and value.tzinfo is None) for value in values):
+                    entry.update(kind="datetime", file=f"{position}.npy")
+                    np.save(tmp_path / entry["file"], np.array(values, dtype="datetime64[us]"))
+                elif all(value is None or isinstance(value, str) for value in values):
+                    entry.update(kind="object", values=values.tolist())
+                else:
+                    return False
+                manifest_columns.append(entry)
+
+            with (tmp_path / "manifest.json").open("w") as f:
+                json.dump({"length": len(frame), "warmup": frame.warmup, "columns": manifest_columns}, f)
+            try:
+                os.replace(tmp_path, path)
+            except OSError:
+                # Another process stored the same key first; its entry is identical
+                pass
+            return True
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def load_features(
+    path: Path | str,
+    trailing_games: Optional[int] = None,
+    cache: Optional[FeatureCache] = None,
+) -> FeatureFrame:
+    """
+    engineer_features(load_game_logs(path, trailing_games)), served from the cache when the log is unchanged.
+    Without a cache the features are always recomputed.
+    """
+    if cache is None:
+        return engineer_features(load_game_logs(path, trailing_games))
+    key = feature_key(path, trailing_games)
+    frame = cache.get(key)
+    if frame is None:
+        frame = engineer_features(load_game_logs(path, trailing_games))
+        cache.put(key, frame)
+    return frame
+
+
+def report_skipped(path: Path, error: Exception) -> None:
+    """
+    on_error callback for the CLIs: prints that a file was skipped.
+    """
+    print(f"Skipping {path}: not a checklist game log ({error})")
+
+
+def load_many_features(
+    paths: List[Path | str],
+    trailing_games: Optional[int] = None,
+    cache: Optional[FeatureCache] = None,
+    max_workers: int = 8,
+    on_error: Optional[Callable[[Path, Exception], None]] = None,
+) -> Dict[str, FeatureFrame]:
+    """
+    load_features for many game logs, keyed by file stem (the player id) in the order given.
+    Cache misses are read concurrently with load_many_game_logs; with on_error, files that are
+    not in the checklist schema are reported to it and left out.
+    """
+    paths = [Path(path) for path in paths]
+    keys = {path: feature_key(path, trailing_games) for path in paths} if cache is not None else {}
+    frames: Dict[str, FeatureFrame] = {}
+    for path, key in keys.items():
+        frame = cache.get(key)
+        if frame is not None:
+            frames[path.stem] = frame
+
+    misses = [path for path in paths if path.stem not in frames]
+    logs = load_many_game_logs(misses, trailing_games, max_workers, on_error)
+    for path in misses:
+        rows = logs.get(path.stem)
+        if rows is None:
+            continue
+        try:
+            frame = engineer_features(rows)
+        except (KeyError, ValueError) as e:
+            if on_error is None:
+                raise
+            on_error(path, e)
+            continue
+        if cache is not None:
+            cache.put(keys[path], frame)
+        frames[path.stem] = frame
+    return {path.stem: frames[path.stem] for path in paths if path.stem in frames}
@@ -0,0 +1,152 @@
+"""
+Local columnar store of player game logs, partitioned by season.
+
+Each season is one Parquet file under data/game_logs/store/season=<season>/,
+sorted by PLAYER_ID (GAME_DATE stored as a timestamp) and written in small
+row groups. Reads push the season
+predicate down to the partition directory and the player predicate down to
+row-group statistics, so loading three seasons for one player touches only
+that player's row groups instead of the full league file.
+
+Usage:
+    python -m src.projections.game_log_store 2023-24 2024-25            # pull from stats.nba.com
+    python -m src.projections.game_log_store 2023-24 --from-csv data/game_logs/game_log_2023-24.csv
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .nba_api_client import fetch_league_game_logs
+
+GAME_LOG_STORE_DIR = Path(__file__).resolve().parents[2] / "data" / "game_logs" / "store"
+ROW_GROUP_SIZE = 2048
+GAME_ID_WIDTH = 10
+
+# PlayerGameLog and LeagueGameLog disagree on id column casing
+COLUMN_ALIASES = {"Player_ID": "PLAYER_ID", "Game_ID": "GAME_ID"}
+
+
+def normalize_game_ids(game_ids: pd.Series) -> pd.Series:
+    """
+    Game ids as the zero-padded strings stats.nba.com returns (e.g. "0022300061");
+    pd.read_csv parses them as integers and drops the leading zeros.
+    """
+    if pd.api.types.is_numeric_dtype(game_ids):
+        game_ids = game_ids.astype("Int64")
+    return game_ids.astype(str).str.zfill(GAME_ID_WIDTH)
+
+
+class GameLogStore:
+    """
+    Season-partitioned Parquet store keyed by PLAYER_ID.
+    """
+
+    def __init__(self, root: Path | str = GAME_LOG_STORE_DIR):
+        self.root = Path(root)
+
+    def season_path(self, season: str) -> Path:
+        return self.root / f"season={season}" / "game_logs.parquet"
+
+    def seasons(self) -> List[str]:
+        """
+        Lists the seasons currently held in the store.
+        """
+        return sorted(path.parent.name.split("=", 1)[1] for path in self.root.glob("season=*/game_logs.parquet"))
+
+    def version(self, seasons: List[str]) -> Dict[str, Optional[List[int]]]:
+        """
+        Size and mtime of each season partition, used to detect changed inputs.
+        """
+        versions: Dict[str, Optional[List[int]]] = {}
+        for season in seasons:
+            path = self.season_path(season)
+            if path.exists():
+                stat = path.stat()
+                versions[season] = [stat.st_size, stat.st_mtime_ns]
+            else:
+                versions[season] = None
+        return versions
+
+    def write_season(self, season: str, df: pd.DataFrame) -> Path:
+        """
+        Replaces a season partition with the given league-wide game log.
+        """
+        df = df.rename(columns=COLUMN_ALIASES).drop(columns=["SEASON"], errors="ignore")
+        df = df.assign(GAME_DATE=pd.to_datetime(df['GAME_DATE'], format='mixed'))
+        if 'GAME_ID' in df.columns:
+            df['GAME_ID'] = normalize_game_ids(df['GAME_ID'])
+        df = df.sort_values(['PLAYER_ID', 'GAME_DATE'], ascending=[True, False])
+
+        path = self.season_path(season)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, path, row_group_size=ROW_GROUP_SIZE, write_statistics=True)
+        return path
+
+    def read(self, player_id: int, seasons: List[str], columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Reads one player's games for the given seasons, most recent first, with a SEASON column.
+        """
+        return self._read(seasons, [("PLAYER_ID", "=", int(player_id))], columns)
+
+    def read_players(self, player_ids: List[int], seasons: List[str], columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Reads several players' games as one stacked frame, most recent first, with a SEASON column.
+        """
+        return self._read(seasons, [("PLAYER_ID", "in", [int(player_id) for player_id in player_ids])], columns)
+
+    def read_season(self, season: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Reads every player's games for one season, most recent first, with a SEASON column.
+        """
+        return self._read([season], None, columns)
+
+    def _read(self, seasons: List[str], filters: Optional[list], columns: Optional[List[str]]) -> pd.DataFrame:
+        frames = []
+        for season in seasons:
+            path = self.season_path(season)
+            if not path.exists():
+                continue
+            table = pq.read_table(path, columns=columns, filters=filters)
+            if table.num_rows:
+                df = table.to_pandas()
+                df['SEASON'] = season
+                frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values('GAME_DATE', ascending=False, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load league-wide game logs into the local season-partitioned store.")
+    parser.add_argument("seasons", nargs="+", help="Seasons to ingest (e.g., 2023-24).")
+    parser.add_argument("--from-csv", help="Ingest a single season from a CSV (e.g., download_nba_stats output) instead of the API.")
+    parser.add_argument("--store", default=str(GAME_LOG_STORE_DIR), help="Root directory of the store.")
+    args = parser.parse_args()
+
+    store = GameLogStore(args.store)
+    if args.from_csv:
+        if len(args.seasons) != 1:
+            raise SystemExit("--from-csv ingests exactly one season.")
+        path = store.write_season(args.seasons[0], pd.read_csv(args.from_csv))
+        print(f"Stored {args.seasons[0]} from {args.from_csv} at {path}")
+        return
+
+    game_logs = fetch_league_game_logs(args.seasons)
+    if game_logs.empty:
+        raise SystemExit("No league game logs returned.")
+    for season, season_logs in game_logs.groupby('SEASON'):
+        path = store.write_season(season, season_logs)
+        print(f"Stored {len(season_logs)} games for {season} at {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Opt-in stage-level instrumentation for the projection scripts.
+
+Scripts wrap their phases in `stage("name")` blocks and batch runs tag each
+worker with `player(name)`. While INSTRUMENTATION is enabled, every block
+records wall time and rows processed, and every nba_api request made inside
+it (via nba_api_client.make_api_request) adds an API call and the bytes
+received to the current stage and player. Disabled, the hooks are no-ops.
+
+At the end of a run, `report()` renders per-stage and per-player summary
+tables and `write_json()` dumps the raw records for trend tracking.
+"""
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+UNSTAGED = "(unstaged)"
+
+_current_stage: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("instrumentation_stage", default=None)
+_current_player: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("instrumentation_player", default=None)
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    api_calls: int = 0
+    bytes_received: int = 0
+    rows: int = 0
+
+    def merge(self, other: "StageStats") -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.api_calls += other.api_calls
+        self.bytes_received += other.bytes_received
+        self.rows += other.rows
+
+
+class Instrumentation:
+    """
+    Thread-safe accumulator of StageStats keyed by (stage, player).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats: Dict[Tuple[str, Optional[str]], StageStats] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._started = time.perf_counter()
+
+    def _entry(self, stage: Optional[str]) -> StageStats:
+        key = (stage or UNSTAGED, _current_player.get())
+        if key not in self._stats:
+            self._stats[key] = StageStats()
+        return self._stats[key]
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[None]:
+        """
+        Times the enclosed block as one call of `name` for the current player.
+        """
+        if not self.enabled:
+            yield
+            return
+        token = _current_stage.set(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_stage.reset(token)
+            with self._lock:
+                entry = self._entry(name)
+                entry.calls += 1
+                entry.seconds += elapsed
+                entry.rows += rows or 0
+
+    @contextmanager
+    def player(self, name: str) -> Iterator[None]:
+        """
+        Attributes every stage recorded in the enclosed block (in this thread) to `name`.
+        """
+        token = _current_player.set(name)
+        try:
+            yield
+        finally:
+            _current_player.reset(token)
+
+    def add_rows(self, rows: int) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entry(_current_stage.get()).rows += rows
+
+    def record_api_call(self, bytes_received: int = 0) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._entry(_current_stage.get())
+            entry.api_calls += 1
+            entry.bytes_received += bytes_received
+
+    def _totals(self, by_player: bool) -> Dict[str, StageStats]:
+        totals: Dict[str, StageStats] = {}
+        with self._lock:
+            for (stage, player), stats in self._stats.items():
+                key = (player or "-") if by_player else stage
+                totals.setdefault(key, StageStats()).merge(stats)
+        return totals
+
+    def report(self, top_players: int = 10) -> str:
+        """
+        Per-stage totals, then the slowest players.
+        """
+        header = f"{'':<24} {'calls':>6} {'seconds':>9} {'api':>5} {'KB in':>9} {'rows':>9}"
+        row = lambda name, s: f"{name[:24]:<24} {s.calls:>6} {s.seconds:>9.3f} {s.api_calls:>5} {s.bytes_received / 1e3:>9,.1f} {s.rows:>9,}"
+
+        lines = ["--- Stage Timings ---", header.replace(" " * 24, f"{'stage':<24}", 1)]
+        stages = self._totals(by_player=False)
+        for name, stats in sorted(stages.items(), key=lambda item: -item[1].seconds):
+            lines.append(row(name, stats))
+
+        players = {name: stats for name, stats in self._totals(by_player=True).items() if name != "-"}
+        if players:
+            lines += ["", f"--- Slowest Players (top {min(top_players, len(players))}) ---", header.replace(" " * 24, f"{'player':<24}", 1)]
+            for name, stats in sorted(players.items(), key=lambda item: -item[1].seconds)[:top_players]:
+                lines.append(row(name, stats))
+
+        lines += ["", f"Wall time: {time.perf_counter() - self._started:.2f}s (stage seconds overlap across concurrent players)"]
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        with self._lock:
+            records = [
+                {"stage": stage, "player": player, **asdict(stats)}
+                for (stage, player), stats in self._stats.items()
+            ]
+        payload = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "wall_seconds": time.perf_counter() - self._started,
+            "records": records,
+        }
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2)
+
+
+INSTRUMENTATION = Instrumentation()
+stage = INSTRUMENTATION.stage
+player = INSTRUMENTATION.player
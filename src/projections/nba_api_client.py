@@ -0,0 +1,138 @@
+"""
+Shared nba_api access for the projection scripts.
+
+Every stats.nba.com request made from src/projections should go through
+make_api_request so that concurrent callers draw from one token bucket and
+stay under the site's throttling.
+"""
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import pandas as pd
+from nba_api.stats.endpoints import leaguegamelog, playergamelog
+from requests.exceptions import ReadTimeout
+
+from .instrumentation import INSTRUMENTATION
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` requests per second with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Blocks until a token is available and consumes it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# One limiter per process, shared by every nba_api caller.
+RATE_LIMITER = TokenBucket(
+    rate=float(os.environ.get("NBA_API_RATE", 1.5)),
+    capacity=int(os.environ.get("NBA_API_BURST", 3)),
+)
+
+
+def make_api_request(api_call: Callable, max_retries: int = 3, delay: int = 5, **kwargs):
+    """
+    Makes a rate-limited API request with a retry mechanism.
+    """
+    for attempt in range(max_retries):
+        RATE_LIMITER.acquire()
+        try:
+            result = api_call(**kwargs)
+            if INSTRUMENTATION.enabled:
+                # Measuring the payload re-encodes it, so only pay for it while profiling
+                response = getattr(result, "nba_response", None)
+                INSTRUMENTATION.record_api_call(len(response.get_response().encode()) if response is not None else 0)
+            return result
+        except ReadTimeout:
+            INSTRUMENTATION.record_api_call()
+            print(f"API call timed out. Retrying in {delay} seconds... (Attempt {attempt + 1}/{max_retries})")
+            time.sleep(delay)
+    print(f"API call failed after {max_retries} attempts.")
+    return None
+
+
+def _map_in_context(executor: ThreadPoolExecutor, fn: Callable, items: List) -> List:
+    """
+    executor.map that runs each call in a copy of the caller's context, so instrumentation
+    stages and player tags follow requests onto the worker threads.
+    """
+    futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+    return [future.result() for future in futures]
+
+
+def _fetch_season_game_log(player_id: int, season: str) -> Optional[pd.DataFrame]:
+    gamelog = make_api_request(playergamelog.PlayerGameLog, player_id=player_id, season=season)
+    if gamelog is None:
+        return None
+    df = gamelog.get_data_frames()[0]
+    df['SEASON'] = season
+    return df
+
+
+def fetch_player_game_logs(player_id: int, seasons: List[str], max_workers: int = 4) -> pd.DataFrame:
+    """
+    Fetches a player's game logs for several seasons concurrently, in season order.
+    """
+    if not seasons:
+        return pd.DataFrame()
+
+    workers = max(1, min(max_workers, len(seasons)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        season_logs = _map_in_context(executor, lambda season: _fetch_season_game_log(player_id, season), seasons)
+
+    season_logs = [df for df in season_logs if df is not None]
+    if not season_logs:
+        return pd.DataFrame()
+    return pd.concat(season_logs, ignore_index=True)
+
+
+def _fetch_league_season_game_log(season: str) -> Optional[pd.DataFrame]:
+    gamelog = make_api_request(leaguegamelog.LeagueGameLog, season=season, player_or_team_abbreviation='P')
+    if gamelog is None:
+        return None
+    df = gamelog.get_data_frames()[0]
+    df['SEASON'] = season
+    return df
+
+
+def fetch_league_game_logs(seasons: List[str], max_workers: int = 4) -> pd.DataFrame:
+    """
+    Fetches every player's game log for several seasons with one league-wide request per season.
+    """
+    if not seasons:
+        return pd.DataFrame()
+
+    workers = max(1, min(max_workers, len(seasons)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        season_logs = _map_in_context(executor, _fetch_league_season_game_log, seasons)
+
+    season_logs = [df for df in season_logs if df is not None]
+    if not season_logs:
+        return pd.DataFrame()
+    return pd.concat(season_logs, ignore_index=True)
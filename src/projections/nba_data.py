@@ -1,6 +1,7 @@
 """
 Static NBA metadata used when Sorare endpoints omit team queries.
 """
+from .team_index import TEAM_INDEX
 
 NBA_CLUBS = [
     {"slug": "atlanta-hawks", "name": "Atlanta Hawks", "code": "ATL"},
@@ -35,6 +36,13 @@ NBA_CLUBS = [
     {"slug": "washington-wizards", "name": "Washington Wizards", "code": "WAS"},
 ]
 
+# Attach nba_api team ids so Sorare clubs join directly against stats.nba.com data
+for club in NBA_CLUBS:
+    club["teamId"] = TEAM_INDEX.team_id_for_slug(club["slug"])
+
+NBA_CLUBS_BY_SLUG = {club["slug"]: club for club in NBA_CLUBS}
+NBA_CLUBS_BY_TEAM_ID = {club["teamId"]: club for club in NBA_CLUBS}
+
 NBA_ROSTERS = {
     "atlanta-hawks": [
         {"slug": "trae-young", "displayName": "Trae Young"},
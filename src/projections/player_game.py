@@ -1,12 +1,26 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from statistics import mean, pstdev
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import csv
-from datetime import datetime
+import hashlib
+import json
+from datetime import date, datetime
+
+import numpy as np
+
+from .context_store import get_context_store
+
+ROLLING_WINDOWS = (5, 10)
+_ROLLING_SERIES = ("minutes", "usage_rate", "true_shooting_pct", "pace", "opponent_def_rating", "sorare_score")
+_NUMERIC_FIELDS = ("minutes", "usage_rate", "true_shooting_pct", "sorare_score", "pace", "opponent_def_rating")
+GAME_LOG_INDEX_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "game_log_index"
+_FINGERPRINT_WINDOW = 4096
+# Bump whenever engineer_features output changes; it is part of every persistent feature cache key
+FEATURE_CONFIG_VERSION = 1
 
 
 @dataclass
@@ -24,241 +38,667 @@ class ProjectionResult:
         return asdict(self)
 
 
-def load_game_logs(path: Path | str, trailing_games: int = 15) -> List[Dict[str, float]]:
-    """Load the player's game logs limited to the most recent games."""
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Game log not found at {path}")
+@dataclass(frozen=True)
+class ProjectionParams:
+    """Tunable weights of the projection blend; the defaults are the hand-tuned originals."""
 
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    for row in rows:
-        row["game_date"] = datetime.fromisoformat(row["game_date"]) if row["game_date"] else None
-        for key in ("minutes", "usage_rate", "true_shooting_pct", "sorare_score", "pace", "opponent_def_rating"):
-            row[key] = float(row[key]) if row[key] != "" else float("nan")
-    rows.sort(key=lambda r: r["game_date"] or datetime.min)
-    return rows[-trailing_games:]
+    prior_weight: float = 0.45
+    minutes_usage_weight: float = 0.35
+    efficiency_weight: float = 0.20
+    vegas_factor: float = 0.1
+    questionable_modifier: float = 0.92
+    probable_modifier: float = 0.97
+    out_modifier: float = 0.0
 
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
 
-def _rolling(values: List[float], window: int) -> List[Optional[float]]:
-    result: List[Optional[float]] = []
-    for idx in range(len(values)):
-        if idx + 1 < window:
-            result.append(None)
-            continue
-        window_values = values[idx + 1 - window : idx + 1]
-        result.append(mean(window_values))
-    return result
 
+DEFAULT_PARAMS = ProjectionParams()
 
-def _rolling_std(values: List[float], window: int) -> List[Optional[float]]:
-    result: List[Optional[float]] = []
-    for idx in range(len(values)):
-        if idx + 1 < window:
-            result.append(None)
-            continue
-        window_values = values[idx + 1 - window : idx + 1]
-        if len(set(window_values)) == 1:
-            result.append(0.0)
-        else:
-            result.append(pstdev(window_values))
-    return result
+
+def _convert_row(row: Dict[str, str]) -> Dict[str, float]:
+    row["game_date"] = datetime.fromisoformat(row["game_date"]) if row["game_date"] else None
+    for key in _NUMERIC_FIELDS:
+        row[key] = float(row[key]) if row[key] != "" else float("nan")
+    return row
+
+
+def _index_path(path: Path) -> Path:
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+    return GAME_LOG_INDEX_DIR / f"{path.stem}-{digest}.json"
 
 
-def _rolling_slope(values: List[float], window: int) -> List[Optional[float]]:
-    result: List[Optional[float]] = []
-    for idx in range(len(values)):
-        if idx + 1 < window:
-            result.append(None)
+def _scan_date_order(f, offset: int, date_index: int, last_date: Optional[str]) -> Tuple[bool, Optional[str], int]:
+    """Checks that the game dates from byte `offset` onward keep ascending order.
+
+    Returns (sorted, last date seen, offset just past the last complete line checked).
+    """
+    f.seek(offset)
+    checked = offset
+    previous = datetime.fromisoformat(last_date) if last_date else None
+    for line in f:
+        if not line.endswith(b"\n"):
+            break
+        checked += len(line)
+        if not line.strip():
             continue
-        window_values = values[idx + 1 - window : idx + 1]
-        n = len(window_values)
-        x_vals = list(range(n))
-        x_mean = mean(x_vals)
-        y_mean = mean(window_values)
-        numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(x_vals, window_values))
-        denominator = sum((x - x_mean) ** 2 for x in x_vals) or 1.0
-        result.append(numerator / denominator)
-    return result
-
-
-def engineer_features(rows: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        value = next(csv.reader([line.decode("utf-8")]))[date_index]
+        if not value:
+            return False, None, checked
+        current = datetime.fromisoformat(value)
+        if previous is not None and current < previous:
+            return False, None, checked
+        previous = current
+    return True, previous.isoformat() if previous else last_date, checked
+
+
+def _prefix_fingerprint(f, header_size: int, checked: int) -> str:
+    """Hash of the header, the first rows and the bytes just before `checked`; its cost does not grow with the file."""
+    digest = hashlib.sha256()
+    head_end = min(checked, header_size + _FINGERPRINT_WINDOW)
+    for start, end in ((0, head_end), (max(head_end, checked - _FINGERPRINT_WINDOW), checked)):
+        f.seek(start)
+        digest.update(f.read(end - start))
+    return digest.hexdigest()
+
+
+def _is_date_sorted(path: Path, header: List[str], header_size: int) -> bool:
+    """Whether the file's rows are in ascending game_date order, tracked in a sidecar index.
+
+    Game logs grow by appending, so when the bytes already checked look unchanged (same
+    fingerprint of the header, first rows and last checked rows as recorded in the index)
+    only the bytes added since are scanned; a file that shrank or was rewritten is rescanned
+    from the header. The fingerprint reads a bounded window, so an append costs the same
+    however large the file is. The sidecar is best effort: if it cannot be read or written
+    the file is simply checked again next time.
+    """
+    stat = path.stat()
+    index_path = _index_path(path)
+    index = None
+    try:
+        with index_path.open() as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if index and index["size"] == stat.st_size and index["mtime_ns"] == stat.st_mtime_ns:
+        return index["sorted"]
+
+    with path.open("rb") as f:
+        resume = (
+            index is not None and index["sorted"] and "prefix_fingerprint" in index
+            and header_size <= index["checked"] <= stat.st_size and index["size"] < stat.st_size
+            and _prefix_fingerprint(f, header_size, index["checked"]) == index["prefix_fingerprint"]
+        )
+        offset, last_date = (index["checked"], index["last_date"]) if resume else (header_size, None)
+        is_sorted, last_date, checked = _scan_date_order(f, offset, header.index("game_date"), last_date)
+        fingerprint = _prefix_fingerprint(f, header_size, checked)
+
+    entry = {
+        "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sorted": is_sorted,
+        "checked": checked, "last_date": last_date, "prefix_fingerprint": fingerprint,
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with index_path.open("w") as f:
+            json.dump(entry, f)
+    except OSError:
+        pass
+    return is_sorted
+
+
+def _read_tail_lines(f, count: int, header_size: int) -> List[str]:
+    """Reads the last `count` non-empty lines by seeking backwards from the end in growing blocks."""
+    f.seek(0, 2)
+    position = f.tell()
+    block = 8192
+    data = b""
+    while position > header_size and data.count(b"\n") <= count + 1:
+        size = min(block, position - header_size)
+        position -= size
+        f.seek(position)
+        data = f.read(size) + data
+        block *= 2
+    lines = data.decode("utf-8").splitlines()
+    if position > header_size:
+        lines = lines[1:]  # may start mid-line
+    return [line for line in lines if line.strip()][-count:]
+
+
+def load_game_logs(path: Path | str, trailing_games: Optional[int] = 15) -> List[Dict[str, float]]:
+    """Load the player's game logs limited to the most recent games (all of them when trailing_games is None).
+
+    Date-sorted files (the normal, append-only case) are read from the end, so only the
+    trailing games are parsed; anything else falls back to reading and sorting every row.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Game log not found at {path}")
+
+    if trailing_games:
+        with path.open("rb") as f:
+            header_line = f.readline()
+            header = next(csv.reader([header_line.decode("utf-8")]), [])
+            if "game_date" in header and _is_date_sorted(path, header, len(header_line)):
+                lines = _read_tail_lines(f, trailing_games, len(header_line))
+                return [_convert_row(row) for row in csv.DictReader(lines, fieldnames=header)]
+
+    with path.open() as f:
+        reader = csv.DictReader(f)
+        rows = [_convert_row(row) for row in reader]
+    rows.sort(key=lambda r: r["game_date"] or datetime.min)
+    return rows[-trailing_games:] if trailing_games is not None else rows
+
+
+def load_many_game_logs(
+    paths: List[Path | str],
+    trailing_games: Optional[int] = 15,
+    max_workers: int = 8,
+    on_error: Optional[Callable[[Path, Exception], None]] = None,
+) -> Dict[str, List[Dict[str, float]]]:
+    """Load several players' game logs concurrently, keyed by file stem (the player id).
+
+    With on_error, files that are not in the checklist schema (KeyError/ValueError) are
+    reported to it and left out instead of failing the whole batch.
+    """
+    paths = [Path(path) for path in paths]
+
+    def load(path: Path) -> Optional[List[Dict[str, float]]]:
+        try:
+            return load_game_logs(path, trailing_games)
+        except (KeyError, ValueError) as e:
+            if on_error is None:
+                raise
+            on_error(path, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths) or 1))) as executor:
+        logs = list(executor.map(load, paths))
+    return {path.stem: rows for path, rows in zip(paths, logs) if rows is not None}
+
+
+def _trailing_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums of each trailing `window` along the last axis; NaN until the window is full."""
+    csum = np.cumsum(values, axis=-1)
+    sums = np.full(values.shape, np.nan)
+    if window > values.shape[-1]:
+        return sums
+    sums[..., window - 1] = csum[..., window - 1]
+    sums[..., window:] = csum[..., window:] - csum[..., :-window]
+    return sums
+
+
+def rolling_stats(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Trailing-window mean, population std and least-squares slope of every series in one pass.
+
+    `values` is (series x games), oldest game first. Each statistic comes from running sums
+    of y, y**2 and t*y, so the cost is O(games) per window regardless of its length. Windows
+    that are not yet full are NaN, as are windows containing a NaN value.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    missing = np.isnan(values)
+    # Centre each series so the running sums of squares do not cancel catastrophically
+    present = np.where(missing, 0.0, values)
+    centre = present.sum(axis=-1, keepdims=True) / np.maximum((~missing).sum(axis=-1, keepdims=True), 1)
+    y = np.where(missing, 0.0, present - centre)
+    t = np.arange(values.shape[-1], dtype=float)
+
+    n_missing = _trailing_sums(missing.astype(float), window)
+    sum_y = _trailing_sums(y, window)
+    sum_yy = _trailing_sums(y * y, window)
+    sum_ty = _trailing_sums(t * y, window)
+
+    mean_y = sum_y / window
+    means = np.where(n_missing > 0, np.nan, mean_y + centre)
+    mean_yy = sum_yy / window
+    variance = mean_yy - mean_y ** 2
+    # Constant windows leave rounding residue of the running sums; treat it as zero spread
+    variance = np.where(variance > 1e-10 * (1.0 + mean_yy), variance, 0.0)
+    stds = np.where(n_missing > 0, np.nan, np.sqrt(variance))
+
+    # Slope against x = 0..window-1 within each window: x = t - start
+    start = t - (window - 1)
+    sum_xy = sum_ty - start * sum_y
+    x_mean = (window - 1) / 2
+    sxx = window * (window * window - 1) / 12 or 1.0
+    slopes = np.where(n_missing > 0, np.nan, (sum_xy - window * x_mean * mean_y) / sxx)
+    return means, stds, slopes
+
+
+class FeatureRow:
+    """Read-only view of one game in a FeatureFrame, indexable like the feature dicts it replaces."""
+
+    __slots__ = ("_frame", "_index")
+
+    def __init__(self, frame: "FeatureFrame", index: int):
+        self._frame = frame
+        self._index = index
+
+    def __getitem__(self, key: str):
+        return self._frame.value(key, self._index)
+
+    def get(self, key: str, default=None):
+        if key not in self._frame.columns:
+            return default
+        return self._frame.value(key, self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._frame.columns
+
+    def keys(self):
+        return self._frame.columns.keys()
+
+    def to_dict(self) -> Dict[str, object]:
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self) -> str:
+        return f"FeatureRow({self.to_dict()!r})"
+
+
+class FeatureFrame:
+    """Struct-of-arrays feature table: one NumPy array per column, oldest game first.
+
+    Rolling columns hold NaN during their warm-up; `warmup` records how many leading
+    games that covers so row views can report None there, as the dict rows did.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], warmup: Optional[Dict[str, int]] = None):
+        self.columns = columns
+        self.warmup = warmup or {}
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, object]]) -> "FeatureFrame":
+        """Builds a frame from game-log rows; all-float fields become float64 arrays, the rest object arrays."""
+        columns: Dict[str, np.ndarray] = {}
+        for key in rows[0] if rows else ():
+            values = [row.get(key) for row in rows]
+            is_float = all(isinstance(value, float) for value in values)
+            columns[key] = np.array(values, dtype=float if is_float else object)
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[FeatureRow]:
+        return (FeatureRow(self, idx) for idx in range(self._length))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("FeatureFrame only supports contiguous slices.")
+            warmup = {key: max(0, min(count, stop) - start) for key, count in self.warmup.items()}
+            return FeatureFrame({key: column[start:stop] for key, column in self.columns.items()}, warmup)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("FeatureFrame index out of range")
+        return FeatureRow(self, index)
+
+    def column(self, key: str) -> np.ndarray:
+        """The raw column (NaN during warm-up), for vectorized consumers."""
+        return self.columns[key]
+
+    def value(self, key: str, index: int):
+        column = self.columns[key]
+        if index < self.warmup.get(key, 0):
+            return None
+        value = column[index]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def to_dicts(self) -> List[Dict[str, object]]:
+        return [row.to_dict() for row in self]
+
+
+def engineer_features(rows: List[Dict[str, float]]) -> FeatureFrame:
     """Engineer trend and context features for the projection checklist."""
+    frame = FeatureFrame.from_rows(rows)
     if not rows:
-        return []
-
-    minutes = [row["minutes"] for row in rows]
-    usage = [row["usage_rate"] for row in rows]
-    ts = [row["true_shooting_pct"] for row in rows]
-    pace = [row["pace"] for row in rows]
-    opp_def = [row["opponent_def_rating"] for row in rows]
-    sorare = [row["sorare_score"] for row in rows]
-
-    minutes_avg_5 = _rolling(minutes, 5)
-    minutes_avg_10 = _rolling(minutes, 10)
-    minutes_trend = _rolling_slope(minutes, 5)
-    usage_avg_5 = _rolling(usage, 5)
-    usage_avg_10 = _rolling(usage, 10)
-    ts_avg_5 = _rolling(ts, 5)
-    ts_avg_10 = _rolling(ts, 10)
-    pace_avg_5 = _rolling(pace, 5)
-    opp_def_avg_5 = _rolling(opp_def, 5)
-    sorare_mean_10 = _rolling(sorare, 10)
-    sorare_std_10 = _rolling_std(sorare, 10)
-
-    enriched: List[Dict[str, float]] = []
-    for idx, row in enumerate(rows):
-        enriched_row = dict(row)
-        enriched_row["minutes_avg_5"] = minutes_avg_5[idx]
-        enriched_row["minutes_avg_10"] = minutes_avg_10[idx]
-        enriched_row["minutes_trend"] = minutes_trend[idx] if minutes_trend[idx] is not None else 0.0
-        enriched_row["usage_avg_5"] = usage_avg_5[idx]
-        enriched_row["usage_avg_10"] = usage_avg_10[idx]
-        enriched_row["ts_avg_5"] = ts_avg_5[idx]
-        enriched_row["ts_avg_10"] = ts_avg_10[idx]
-        enriched_row["pace_avg_5"] = pace_avg_5[idx]
-        enriched_row["opp_def_avg_5"] = opp_def_avg_5[idx]
-        enriched_row["sorare_mean_10"] = sorare_mean_10[idx]
-        enriched_row["sorare_std_10"] = sorare_std_10[idx]
-
-        enriched_row["flag_high_pace"] = int(pace[idx] > (pace_avg_5[idx] or pace[idx]) * 1.02) if pace_avg_5[idx] else 0
-        enriched_row["flag_low_minutes"] = int(minutes[idx] < (minutes_avg_5[idx] or minutes[idx]) * 0.9) if minutes_avg_5[idx] else 0
-        enriched_row["flag_efficiency_spike"] = int(ts[idx] > (ts_avg_5[idx] or ts[idx]) * 1.05) if ts_avg_5[idx] else 0
-        enriched.append(enriched_row)
-    return enriched
-
-
-def _injury_minutes_modifier(status: Optional[str]) -> float:
+        return frame
+
+    series = np.array([[row[key] for row in rows] for key in _ROLLING_SERIES], dtype=float)
+    minutes, usage, ts, pace, opp_def, sorare = series
+    stats = {window: rolling_stats(series, window) for window in ROLLING_WINDOWS}
+    means_5, _, slopes_5 = stats[5]
+    means_10, stds_10, _ = stats[10]
+
+    rolling_columns = {
+        "minutes_avg_5": (means_5[0], 5),
+        "minutes_avg_10": (means_10[0], 10),
+        "usage_avg_5": (means_5[1], 5),
+        "usage_avg_10": (means_10[1], 10),
+        "ts_avg_5": (means_5[2], 5),
+        "ts_avg_10": (means_10[2], 10),
+        "pace_avg_5": (means_5[3], 5),
+        "opp_def_avg_5": (means_5[4], 5),
+        "sorare_mean_10": (means_10[5], 10),
+        "sorare_std_10": (stds_10[5], 10),
+    }
+    minutes_trend = slopes_5[0].copy()
+    minutes_trend[: ROLLING_WINDOWS[0] - 1] = 0.0
+    for key, (values, window) in rolling_columns.items():
+        frame.columns[key] = values
+        frame.warmup[key] = min(window - 1, len(frame))
+        if key == "minutes_avg_10":
+            frame.columns["minutes_trend"] = minutes_trend
+
+    # A flag needs a usable (non-zero, full-window) average; comparisons against NaN are False
+    def flag(current: np.ndarray, average: np.ndarray, factor: float, above: bool) -> np.ndarray:
+        usable = np.nan_to_num(average) != 0
+        hit = current > average * factor if above else current < average * factor
+        return (usable & hit).astype(int)
+
+    frame.columns["flag_high_pace"] = flag(pace, means_5[3], 1.02, above=True)
+    frame.columns["flag_low_minutes"] = flag(minutes, means_5[0], 0.9, above=False)
+    frame.columns["flag_efficiency_spike"] = flag(ts, means_5[2], 1.05, above=True)
+    return frame
+
+
+def _injury_minutes_modifier(status: Optional[str], params: ProjectionParams = DEFAULT_PARAMS) -> float:
     if not status:
         return 1.0
     status = status.lower()
     if "questionable" in status:
-        return 0.92
+        return params.questionable_modifier
     if "probable" in status:
-        return 0.97
+        return params.probable_modifier
     if "out" in status:
-        return 0.0
+        return params.out_modifier
     return 1.0
 
 
-def project_player_game(features: List[Dict[str, float]], context: Dict[str, float | str]) -> ProjectionResult:
-    """Project the upcoming game based on feature priors and contextual adjustments."""
-    if not features:
-        raise ValueError("Feature set is empty; cannot project player.")
-
-    latest = features[-1]
-    player_id = str(context.get("player_id") or context.get("player_name") or "unknown_player")
-
-    base_minutes = latest.get("minutes_avg_5") or latest["minutes"]
-    projected_minutes = float(context.get("projected_minutes", base_minutes))
-    minutes_trend = latest.get("minutes_trend", 0.0)
-    minutes_blend = 0.55 * projected_minutes + 0.45 * base_minutes + minutes_trend
-    minutes_blend *= _injury_minutes_modifier(context.get("injury_status"))
-    minutes_blend = max(minutes_blend, 0.0)
-
-    base_usage = latest.get("usage_avg_5") or latest["usage_rate"]
-    pace_context = float(context.get("pace_context", latest.get("pace_avg_5") or latest["pace"]))
-    pace_anchor = latest.get("pace_avg_5") or pace_context
-    usage_adjustment = 1 + (pace_context - pace_anchor) / 100.0
-    expected_usage = base_usage * usage_adjustment
-
-    base_eff = latest.get("ts_avg_5") or latest["true_shooting_pct"]
-    opp_def_anchor = latest.get("opp_def_avg_5") or latest.get("opponent_def_rating", 110.0)
-    opp_scheme = float(context.get("opponent_def_rating", opp_def_anchor))
-    efficiency_adjustment = 1 - (opp_scheme - opp_def_anchor) / 250.0 if opp_def_anchor else 1.0
+# Latest-game features read by the projection; missing or warm-up values are NaN in the batch arrays
+PROJECTION_FEATURES = (
+    "minutes", "minutes_avg_5", "minutes_trend", "usage_rate", "usage_avg_5", "pace", "pace_avg_5",
+    "true_shooting_pct", "ts_avg_5", "opponent_def_rating", "opp_def_avg_5", "sorare_score",
+    "sorare_mean_10", "sorare_std_10", "flag_high_pace", "flag_low_minutes",
+)
+CONTEXT_FIELDS = ("projected_minutes", "pace_context", "opponent_def_rating", "vegas_total")
+
+
+def _or(value: np.ndarray, fallback) -> np.ndarray:
+    """Vectorized `value or fallback`: NaN (missing) and zero fall through."""
+    return np.where(np.isnan(value) | (value == 0), fallback, value)
+
+
+def _given(value: np.ndarray, fallback) -> np.ndarray:
+    """Vectorized `context.get(key, fallback)`: only NaN (missing) falls through."""
+    return np.where(np.isnan(value), fallback, value)
+
+
+def project_columns(
+    latest: Dict[str, np.ndarray],
+    context: Dict[str, np.ndarray],
+    player_ids: List[str],
+    injury_statuses: List[Optional[str]],
+    params: ProjectionParams = DEFAULT_PARAMS,
+    with_notes: bool = True,
+) -> Dict[str, np.ndarray]:
+    """Vectorized project_player_game for a whole slate.
+
+    `latest` maps PROJECTION_FEATURES to one value per player and `context` maps
+    CONTEXT_FIELDS likewise, with NaN for anything missing. Returns a columnar table
+    with the ProjectionResult fields; notes are left empty when with_notes is False.
+    """
+    n = len(player_ids)
+    column = lambda source, key: source.get(key, np.full(n, np.nan))
+
+    base_minutes = _or(column(latest, "minutes_avg_5"), column(latest, "minutes"))
+    projected_minutes = _given(column(context, "projected_minutes"), base_minutes)
+    minutes_trend = _given(column(latest, "minutes_trend"), 0.0)
+    modifiers = {status: _injury_minutes_modifier(status, params) for status in set(injury_statuses)}
+    injury_modifier = np.array([modifiers[status] for status in injury_statuses], dtype=float)
+    minutes_blend = (0.55 * projected_minutes + 0.45 * base_minutes + minutes_trend) * injury_modifier
+    minutes_blend = np.maximum(minutes_blend, 0.0)
+
+    pace_avg_5 = column(latest, "pace_avg_5")
+    base_usage = _or(column(latest, "usage_avg_5"), column(latest, "usage_rate"))
+    pace_context = _given(column(context, "pace_context"), _or(pace_avg_5, column(latest, "pace")))
+    pace_anchor = _or(pace_avg_5, pace_context)
+    expected_usage = base_usage * (1 + (pace_context - pace_anchor) / 100.0)
+
+    base_eff = _or(column(latest, "ts_avg_5"), column(latest, "true_shooting_pct"))
+    opp_def_anchor = _or(column(latest, "opp_def_avg_5"), _given(column(latest, "opponent_def_rating"), 110.0))
+    opp_scheme = _given(column(context, "opponent_def_rating"), opp_def_anchor)
+    efficiency_adjustment = np.where(opp_def_anchor == 0, 1.0, 1 - (opp_scheme - opp_def_anchor) / 250.0)
     expected_efficiency = base_eff * efficiency_adjustment
 
-    sorare_prior = latest.get("sorare_mean_10") or latest["sorare_score"]
+    sorare_prior = _or(column(latest, "sorare_mean_10"), column(latest, "sorare_score"))
     pace_bonus = (pace_context - pace_anchor) * 0.25
-    vegas_total = float(context.get("vegas_total", 220.0))
-    vegas_adjustment = (vegas_total - 220.0) * 0.1
+    vegas_adjustment = (_given(column(context, "vegas_total"), 220.0) - 220.0) * params.vegas_factor
 
     expected_score = (
-        0.45 * sorare_prior
-        + 0.35 * (minutes_blend * 1.15 + expected_usage * 0.55)
-        + 0.20 * (expected_efficiency * 60 + pace_bonus)
+        params.prior_weight * sorare_prior
+        + params.minutes_usage_weight * (minutes_blend * 1.15 + expected_usage * 0.55)
+        + params.efficiency_weight * (expected_efficiency * 60 + pace_bonus)
         + vegas_adjustment
     )
 
-    sorare_std = latest.get("sorare_std_10") or 7.5
-    ci_width = max(5.0, sorare_std * 1.2)
-    lower_ci = max(0.0, expected_score - ci_width)
+    ci_width = np.maximum(5.0, _or(column(latest, "sorare_std_10"), 7.5) * 1.2)
+    lower_ci = np.maximum(0.0, expected_score - ci_width)
     upper_ci = expected_score + ci_width
 
-    notes: List[str] = []
-    if latest.get("flag_high_pace"):
-        notes.append("Recent games at above-average pace")
-    if latest.get("flag_low_minutes"):
-        notes.append("Recent minutes dip to monitor")
-    if context.get("injury_status"):
-        notes.append(f"Injury status: {context['injury_status']}")
-
-    return ProjectionResult(
-        player_id=player_id,
-        expected_score=float(expected_score),
-        expected_minutes=float(minutes_blend),
-        expected_usage=float(expected_usage),
-        expected_efficiency=float(expected_efficiency),
-        lower_ci=float(lower_ci),
-        upper_ci=float(upper_ci),
-        notes="; ".join(notes),
-    )
+    high_pace = np.nan_to_num(column(latest, "flag_high_pace")) != 0
+    low_minutes = np.nan_to_num(column(latest, "flag_low_minutes")) != 0
+    notes = [] if with_notes else [""] * n
+    for idx, status in enumerate(injury_statuses if with_notes else ()):
+        player_notes: List[str] = []
+        if high_pace[idx]:
+            player_notes.append("Recent games at above-average pace")
+        if low_minutes[idx]:
+            player_notes.append("Recent minutes dip to monitor")
+        if status:
+            player_notes.append(f"Injury status: {status}")
+        notes.append("; ".join(player_notes))
+
+    return {
+        "player_id": np.array(player_ids, dtype=object),
+        "expected_score": expected_score,
+        "expected_minutes": minutes_blend,
+        "expected_usage": expected_usage,
+        "expected_efficiency": expected_efficiency,
+        "lower_ci": lower_ci,
+        "upper_ci": upper_ci,
+        "notes": np.array(notes, dtype=object),
+    }
+
+
+def _context_value(value) -> float:
+    return float(value) if value not in (None, "") else np.nan
+
+
+def _latest_features(feature_sets: List[FeatureFrame | List[Dict[str, float]]]) -> Dict[str, np.ndarray]:
+    latest = {key: np.full(len(feature_sets), np.nan) for key in PROJECTION_FEATURES}
+    for idx, features in enumerate(feature_sets):
+        if not len(features):
+            raise ValueError("Feature set is empty; cannot project player.")
+        if isinstance(features, FeatureFrame):
+            for key in PROJECTION_FEATURES:
+                if key in features.columns:
+                    latest[key][idx] = features.columns[key][-1]
+        else:
+            row = features[-1]
+            for key in PROJECTION_FEATURES:
+                if row.get(key) is not None:
+                    latest[key][idx] = row[key]
+    return latest
 
 
-def backtest_recent_games(rows: List[Dict[str, float]], lookback: int = 5) -> List[Dict[str, float]]:
-    """Backtest the projection process over the last N games."""
-    if len(rows) <= lookback:
-        raise ValueError("Not enough games to run a backtest.")
+def project_slate(
+    feature_sets: List[FeatureFrame | List[Dict[str, float]]],
+    contexts: List[Dict[str, float | str]],
+    as_table: bool = False,
+    params: ProjectionParams = DEFAULT_PARAMS,
+) -> List[ProjectionResult] | Dict[str, np.ndarray]:
+    """Project every player on a slate at once from their features and upcoming-game contexts.
+
+    Returns one ProjectionResult per player, or the columnar table from project_columns
+    when as_table is True.
+    """
+    if len(feature_sets) != len(contexts):
+        raise ValueError("Expected one context per feature set.")
+    latest = _latest_features(feature_sets)
+    context_columns = {key: np.array([_context_value(context.get(key)) for context in contexts]) for key in CONTEXT_FIELDS}
+    player_ids = [str(context.get("player_id") or context.get("player_name") or "unknown_player") for context in contexts]
+    table = project_columns(latest, context_columns, player_ids, [context.get("injury_status") for context in contexts], params)
+    if as_table:
+        return table
+
+    fields = [key for key in table if key not in ("player_id", "notes")]
+    return [
+        ProjectionResult(
+            player_id=table["player_id"][idx],
+            notes=table["notes"][idx],
+            **{key: float(table[key][idx]) for key in fields},
+        )
+        for idx in range(len(player_ids))
+    ]
+
+
+def project_player_game(
+    features: FeatureFrame | List[Dict[str, float]],
+    context: Dict[str, float | str],
+    params: ProjectionParams = DEFAULT_PARAMS,
+) -> ProjectionResult:
+    """Project the upcoming game based on feature priors and contextual adjustments."""
+    if not features:
+        raise ValueError("Feature set is empty; cannot project player.")
+    return project_slate([features], [context], params=params)[0]
+
+
+def _as_date(value: date | str) -> date:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _backtest_indices(rows: List[Dict[str, float]], start: Optional[date | str], end: Optional[date | str]) -> List[int]:
+    start_date = _as_date(start) if start is not None else None
+    end_date = _as_date(end) if end is not None else None
+    indices = []
+    for idx in range(ROLLING_WINDOWS[0], len(rows)):
+        game_date = rows[idx]["game_date"]
+        game_day = game_date.date() if isinstance(game_date, datetime) else None
+        if start_date and (game_day is None or game_day < start_date):
+            continue
+        if end_date and (game_day is None or game_day > end_date):
+            continue
+        indices.append(idx)
+    return indices
+
+
+def walk_forward_inputs(
+    rows: List[Dict[str, float]] | FeatureFrame,
+    start: Optional[date | str] = None,
+    end: Optional[date | str] = None,
+    indices: Optional[List[int]] = None,
+) -> Tuple[List[int], Dict[str, np.ndarray], Dict[str, np.ndarray], List[str]]:
+    """The project_columns inputs of a walk-forward backtest: evaluated row indices, latest
+    features, upcoming-game context and injury statuses, one entry per evaluated game.
+
+    Rolling features are causal, so the features of rows[:idx] are the first idx rows of the
+    features of the full series; they are computed once for every evaluated game. Games with
+    fewer than five prior games are skipped. Statuses come from an injury_status column when
+    the log has one and are "Healthy" otherwise. `rows` may also be an already engineered
+    FeatureFrame (e.g. from the feature cache), whose raw columns stand in for the rows.
+    """
+    features = rows if isinstance(rows, FeatureFrame) else engineer_features(rows)
+    if indices is None:
+        indices = _backtest_indices(rows, start, end)
+    indices = [idx for idx in indices if idx >= ROLLING_WINDOWS[0]]
+    if not indices:
+        return [], {}, {}, []
+
+    # Each game is projected from the last row of its history, features[idx - 1]
+    previous = np.array(indices) - 1
+    latest = {key: features.column(key)[previous].astype(float) for key in PROJECTION_FEATURES if key in features.columns}
+    actual_pace = features.column("pace")[previous + 1]
+    actual_opp_def = features.column("opponent_def_rating")[previous + 1]
+    pace_context = _or(actual_pace, latest["pace_avg_5"])
+    context = {
+        "projected_minutes": latest["minutes_avg_5"],
+        "pace_context": pace_context,
+        "vegas_total": 220.0 + (pace_context - 100) * 1.5,
+        "opponent_def_rating": _or(actual_opp_def, latest["opp_def_avg_5"]),
+    }
+    injury_statuses = [rows[idx].get("injury_status") or "Healthy" for idx in indices]
+    return indices, latest, context, injury_statuses
+
+
+def walk_forward_backtest(
+    rows: List[Dict[str, float]] | FeatureFrame,
+    start: Optional[date | str] = None,
+    end: Optional[date | str] = None,
+    indices: Optional[List[int]] = None,
+    params: ProjectionParams = DEFAULT_PARAMS,
+) -> List[Dict[str, float]]:
+    """Project every game (or those between start and end) from the games before it.
+
+    Every evaluated game is projected in a single project_columns call over the
+    walk_forward_inputs arrays.
+    """
+    indices, latest, context, injury_statuses = walk_forward_inputs(rows, start, end, indices)
+    if not indices:
+        return []
+    player_ids = [str(rows[idx].get("player_id") or "unknown_player") for idx in indices]
+    projections = project_columns(latest, context, player_ids, injury_statuses, params)
 
     results: List[Dict[str, float]] = []
-    for idx in range(len(rows) - lookback, len(rows)):
-        history = rows[:idx]
+    for position, idx in enumerate(indices):
         actual = rows[idx]
-        if len(history) < 5:
-            continue
-        features = engineer_features(history)
-        recent_minutes = [h["minutes"] for h in history[-5:]]
-        pace_context = actual.get("pace") or mean([h["pace"] for h in history[-5:]])
-        opp_def_context = actual.get("opponent_def_rating") or mean([h["opponent_def_rating"] for h in history[-5:]])
-        context = {
-            "player_id": actual.get("player_id", "unknown_player"),
-            "projected_minutes": mean(recent_minutes),
-            "injury_status": "Healthy",
-            "pace_context": pace_context,
-            "vegas_total": 220.0 + (pace_context - 100) * 1.5,
-            "opponent_def_rating": opp_def_context,
-        }
-        projection = project_player_game(features, context)
         results.append(
             {
                 "game_date": actual["game_date"].date().isoformat() if isinstance(actual["game_date"], datetime) else actual["game_date"],
                 "opponent": actual.get("opponent"),
-                "projected_score": projection.expected_score,
+                "projected_score": float(projections["expected_score"][position]),
                 "actual_score": actual["sorare_score"],
-                "projection_minutes": projection.expected_minutes,
+                "projection_minutes": float(projections["expected_minutes"][position]),
                 "actual_minutes": actual["minutes"],
-                "notes": projection.notes,
+                "notes": projections["notes"][position],
             }
         )
     return results
 
 
+def backtest_recent_games(rows: List[Dict[str, float]] | FeatureFrame, lookback: int = 5) -> List[Dict[str, float]]:
+    """Backtest the projection process over the last N games."""
+    if len(rows) <= lookback:
+        raise ValueError("Not enough games to run a backtest.")
+    return walk_forward_backtest(rows, indices=list(range(len(rows) - lookback, len(rows))))
+
+
+def backtest_metrics(results: List[Dict[str, float]]) -> Dict[str, float]:
+    """MAE, RMSE and mean minutes error (projected - actual) of backtest rows, ignoring games with missing values."""
+    if not results:
+        return {"games": 0, "mae": float("nan"), "rmse": float("nan"), "mean_minutes_error": float("nan")}
+    score_errors = np.array([row["projected_score"] - row["actual_score"] for row in results], dtype=float)
+    minutes_errors = np.array([row["projection_minutes"] - row["actual_minutes"] for row in results], dtype=float)
+    return error_metrics(score_errors, minutes_errors)
+
+
+def error_metrics(score_errors: np.ndarray, minutes_errors: np.ndarray) -> Dict[str, float]:
+    """backtest_metrics over arrays of projected - actual score and minutes errors."""
+    if not len(score_errors):
+        return {"games": 0, "mae": float("nan"), "rmse": float("nan"), "mean_minutes_error": float("nan")}
+    return {
+        "games": len(score_errors),
+        "mae": float(np.nanmean(np.abs(score_errors))),
+        "rmse": float(np.sqrt(np.nanmean(score_errors ** 2))),
+        "mean_minutes_error": float(np.nanmean(minutes_errors)),
+    }
+
+
 def prepare_upcoming_context(path: Path | str, player_id: str) -> Dict[str, str | float]:
-    """Return the latest context row for the given player."""
+    """Return the latest context row for the given player, from the indexed context store."""
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Upcoming context not found at {path}")
 
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        rows = [row for row in reader if row.get("player_id") == player_id]
-    if not rows:
+    latest = get_context_store(path).get(player_id)
+    if latest is None:
         raise ValueError(f"No context rows found for player_id={player_id}")
-    latest = rows[-1]
-    for key in ("projected_minutes", "pace_context", "vegas_total", "opponent_def_rating"):
-        if key in latest and latest[key] != "":
-            latest[key] = float(latest[key])
     return latest
 
 
@@ -0,0 +1,134 @@
+"""
+In-memory player-name resolution shared by the projection scripts.
+
+Names are normalised (accents folded, punctuation and hyphens collapsed, lower
+case) so "Nikola Jokić", "nikola jokic" and "Shai-Gilgeous-Alexander" hit the
+exact-match hash directly. Misspellings fall back to a trigram index that
+narrows the roster to a handful of candidates before fuzzy scoring.
+"""
+from __future__ import annotations
+
+import csv
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from thefuzz import process
+
+PLAYER_CSV_PATH = Path(__file__).resolve().parents[2] / "csv" / "player.csv"
+FUZZY_THRESHOLD = 80
+MAX_CANDIDATES = 25
+
+
+def normalize_name(name: str) -> str:
+    """
+    Folds accents and punctuation: "Luka Dončić" -> "luka doncic", "D'Angelo" -> "dangelo".
+    """
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    name = re.sub(r"['.]", "", name)
+    return re.sub(r"[^a-z0-9]+", " ", name).strip()
+
+
+def _trigrams(normalized: str) -> Set[str]:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class PlayerEntry:
+    id: int
+    full_name: str
+    is_active: bool
+
+
+@dataclass(frozen=True)
+class PlayerMatch:
+    id: int
+    full_name: str
+    score: int
+    exact: bool
+
+
+class PlayerNameIndex:
+    """
+    Normalised exact-match hash plus a trigram candidate index over every player.
+    """
+
+    def __init__(self, entries: List[PlayerEntry]):
+        self.entries = entries
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._trigrams: Dict[str, List[int]] = defaultdict(list)
+        for i, entry in enumerate(entries):
+            normalized = normalize_name(entry.full_name)
+            self._exact[normalized].append(i)
+            for gram in _trigrams(normalized):
+                self._trigrams[gram].append(i)
+
+    def _eligible(self, i: int, active_only: bool) -> bool:
+        return self.entries[i].is_active or not active_only
+
+    def exact(self, name: str, active_only: bool = True) -> Optional[PlayerEntry]:
+        """
+        Exact lookup on the normalised name; active players win ties.
+        """
+        matches = [i for i in self._exact.get(normalize_name(name), []) if self._eligible(i, active_only)]
+        if not matches:
+            return None
+        return self.entries[max(matches, key=lambda i: self.entries[i].is_active)]
+
+    def candidates(self, name: str, active_only: bool = True, limit: int = MAX_CANDIDATES) -> List[PlayerEntry]:
+        """
+        Players sharing the most trigrams with the name, best first.
+        """
+        counts: Counter = Counter()
+        for gram in _trigrams(normalize_name(name)):
+            counts.update(i for i in self._trigrams.get(gram, ()) if self._eligible(i, active_only))
+        return [self.entries[i] for i, _ in counts.most_common(limit)]
+
+    def resolve(self, name: str, active_only: bool = True, threshold: int = FUZZY_THRESHOLD) -> Optional[PlayerMatch]:
+        """
+        Resolves a name to a player: exact normalised match first, then fuzzy scoring over trigram candidates.
+        """
+        entry = self.exact(name, active_only)
+        if entry is not None:
+            return PlayerMatch(entry.id, entry.full_name, 100, True)
+
+        candidates = self.candidates(name, active_only)
+        if not candidates:
+            return None
+        by_name = {normalize_name(candidate.full_name): candidate for candidate in candidates}
+        best_match = process.extractOne(normalize_name(name), list(by_name))
+        if best_match and best_match[1] > threshold:
+            entry = by_name[best_match[0]]
+            return PlayerMatch(entry.id, entry.full_name, best_match[1], False)
+        return None
+
+
+def _load_entries(path: Path) -> List[PlayerEntry]:
+    if path.exists():
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        return [PlayerEntry(int(row["id"]), row["full_name"], row["is_active"] in ("1", "True", "true")) for row in rows]
+
+    from nba_api.stats.static import players
+
+    return [PlayerEntry(int(p["id"]), p["full_name"], bool(p["is_active"])) for p in players.get_players()]
+
+
+_index: Optional[PlayerNameIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_player_index(path: Path | str = PLAYER_CSV_PATH) -> PlayerNameIndex:
+    """
+    Returns the process-wide player index, building it on first use.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = PlayerNameIndex(_load_entries(Path(path)))
+        return _index
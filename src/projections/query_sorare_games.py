@@ -17,7 +17,9 @@ from typing import Dict, List, Optional, Tuple
 
 import requests
 
+from .nba_data import NBA_CLUBS, NBA_CLUBS_BY_SLUG, NBA_CLUBS_BY_TEAM_ID, NBA_ROSTERS
 from .sorare_auth import GRAPHQL_URL, SorareAuthenticator
+from .team_index import TEAM_INDEX
 
 
 RECENT_SCORES_QUERY = """
@@ -202,6 +204,11 @@ def _graphql(
 def _filter_clubs(search_term: Optional[str]) -> List[Dict[str, object]]:
     clubs = NBA_CLUBS
     if search_term:
+        # Exact slugs and current or historical abbreviations (e.g. "NJN") resolve directly
+        team_id = TEAM_INDEX.team_id(search_term)
+        club = NBA_CLUBS_BY_SLUG.get(search_term.lower()) or (NBA_CLUBS_BY_TEAM_ID.get(team_id) if team_id else None)
+        if club is not None:
+            return [club]
         term = search_term.lower()
         clubs = [
             club
@@ -269,7 +276,7 @@ def parse_args() -> argparse.Namespace:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=f"Queries:\n  {available}",
     )
-    parser.add_argument("--team", help="Team name/slug/code to pre-filter (e.g. lakers)")
+    parser.add_argument("--team", help="Team name/slug/code to pre-filter (e.g. lakers, NJN)")
     parser.add_argument("--player-slug", help="Sorare player slug (e.g. lebron-james)")
     parser.add_argument("--query", choices=QUERY_MAP.keys(), help="Which query to run")
     parser.add_argument("--limit", type=int, help="Number of recent games (default: 10)")
@@ -0,0 +1,78 @@
+"""
+Content-addressed cache for per-player analysis results.
+
+A result is stored under the SHA-256 of everything that determines it (player
+id, season window, scoring config fingerprint, input data versions, ...), so
+re-running an unchanged player is a file read and any change to the inputs
+simply produces a new key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+RESULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "results"
+
+
+def content_key(parts: Dict[str, Any]) -> str:
+    """
+    Hashes a JSON-serialisable description of a computation's inputs.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    One JSON file per key under RESULT_CACHE_DIR, fanned out by key prefix.
+    """
+
+    def __init__(self, root: Path | str = RESULT_CACHE_DIR):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with path.open() as f:
+            return json.load(f)
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+
+
+def write_artifact_if_changed(df: pd.DataFrame, output_file: str, manifest_path: Path | str) -> Tuple[str, bool]:
+    """
+    Writes df to output_file unless its content matches the last artifact recorded in the manifest.
+    Returns (path of the current artifact, whether it was written by this call).
+    """
+    manifest_path = Path(manifest_path)
+    content = df.to_csv(index=False)
+    digest = hashlib.sha256(content.encode()).hexdigest()
+
+    if manifest_path.exists():
+        with manifest_path.open() as f:
+            manifest = json.load(f)
+        if manifest.get("sha256") == digest and os.path.isfile(manifest.get("path", "")):
+            return manifest["path"], False
+
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, "w", newline="") as f:
+        f.write(content)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with manifest_path.open("w") as f:
+        json.dump({"sha256": digest, "path": output_file}, f)
+    return output_file, True
@@ -0,0 +1,200 @@
+"""
+Persisted per-player rolling AAS form (L10/L30/L50).
+
+Each player keeps a ring buffer of their most recent AAS values plus a running
+sum per window, so appending a newly played game is O(1) and a nightly refresh
+only touches the players who actually played.
+
+Each refresh pulls games from the latest game date already in the store,
+inclusive, so a missed nightly run is caught up on the next one and games
+that were not final at the last run (late West Coast tips) are picked up.
+Games on or before a player's last recorded game are skipped, so the overlap
+is harmless. An empty store (first run, or after deleting the file) is seeded
+from the whole current season; pass --date-from to seed from a later date.
+
+The AAS scripts read L10/L30/L50 from the store (calculate_short_term_trends)
+when it is current through the player's latest game, and fall back to their
+full game logs otherwise.
+
+Usage:
+    python -m src.projections.rolling_form                 # catch up since the latest stored game
+    python -m src.projections.rolling_form --date-from 2025-10-21
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+from nba_api.stats.endpoints import leaguegamelog
+
+from .aas import calculate_aas
+from .nba_api_client import make_api_request
+from .standings import get_current_season
+
+TREND_WINDOWS = (10, 30, 50)
+ROLLING_FORM_PATH = Path(__file__).resolve().parents[2] / "data" / "cache" / "rolling_form.json"
+
+
+@dataclass
+class PlayerForm:
+    """
+    Rolling AAS state for one player: a ring buffer sized to the largest window and one running sum per window.
+    """
+
+    last_game_date: str = ""
+    games: int = 0
+    buffer: List[float] = field(default_factory=lambda: [0.0] * max(TREND_WINDOWS))
+    sums: Dict[int, float] = field(default_factory=lambda: {n: 0.0 for n in TREND_WINDOWS})
+
+    def push(self, aas: float) -> None:
+        capacity = len(self.buffer)
+        for n in TREND_WINDOWS:
+            self.sums[n] += aas
+            if self.games >= n:
+                # Value that falls out of the n-game window, still held in the ring
+                self.sums[n] -= self.buffer[(self.games - n) % capacity]
+        self.buffer[self.games % capacity] = aas
+        self.games += 1
+
+    def trends(self) -> Dict[str, Optional[float]]:
+        """
+        Returns L10/L30/L50 AAS in the same shape as calculate_short_term_trends.
+        """
+        return {f"L{n}": self.sums[n] / n if self.games >= n else None for n in TREND_WINDOWS}
+
+    def to_json(self) -> Dict[str, object]:
+        return {"last_game_date": self.last_game_date, "games": self.games, "buffer": self.buffer}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, object]) -> "PlayerForm":
+        form = cls(last_game_date=data["last_game_date"], games=data["games"], buffer=list(data["buffer"]))
+        # Sums are rebuilt from the buffer on load so float drift never accumulates across runs
+        capacity = len(form.buffer)
+        for n in TREND_WINDOWS:
+            count = min(n, form.games)
+            form.sums[n] = sum(form.buffer[(form.games - 1 - i) % capacity] for i in range(count))
+        return form
+
+
+class RollingFormStore:
+    """
+    JSON-backed collection of PlayerForm states keyed by player id.
+    """
+
+    def __init__(self, path: Path | str = ROLLING_FORM_PATH):
+        self.path = Path(path)
+        self.players: Dict[str, PlayerForm] = {}
+        if self.path.exists():
+            with self.path.open() as f:
+                raw = json.load(f)
+            self.players = {player_id: PlayerForm.from_json(data) for player_id, data in raw.items()}
+
+    def append_game(self, player_id, game_date: str, aas: float) -> bool:
+        """
+        Appends one game if it is newer than the player's last recorded game. Returns True when applied.
+        """
+        form = self.players.setdefault(str(player_id), PlayerForm())
+        if game_date <= form.last_game_date:
+            return False
+        form.push(float(aas))
+        form.last_game_date = game_date
+        return True
+
+    def apply_game_log(self, df: pd.DataFrame) -> List[str]:
+        """
+        Appends every new game in a (possibly league-wide) game log and returns the ids of the players updated.
+        """
+        if df.empty:
+            return []
+        games = pd.DataFrame({
+            'PLAYER_ID': df['PLAYER_ID'].astype(str),
+            'GAME_DATE': pd.to_datetime(df['GAME_DATE']).dt.strftime('%Y-%m-%d'),
+            'AAS': df['AAS'] if 'AAS' in df.columns else calculate_aas(df),
+        }).sort_values(['PLAYER_ID', 'GAME_DATE'])
+
+        updated = set()
+        for player_id, game_date, aas in games.itertuples(index=False):
+            if self.append_game(player_id, game_date, aas):
+                updated.add(player_id)
+        return sorted(updated)
+
+    def latest_game_date(self) -> Optional[str]:
+        """
+        Most recent game date recorded for any player, or None for an empty store.
+        """
+        return max((form.last_game_date for form in self.players.values() if form.last_game_date), default=None)
+
+    def trends(self, player_id) -> Dict[str, Optional[float]]:
+        form = self.players.get(str(player_id))
+        if form is None:
+            return {f"L{n}": None for n in TREND_WINDOWS}
+        return form.trends()
+
+    def trends_through(self, player_id, last_game_date) -> Dict[str, Optional[float]]:
+        """
+        Stored trends for a player whose form is current through last_game_date (any date-like value);
+        every window is None when the store is behind or ahead of that game.
+        """
+        form = self.players.get(str(player_id))
+        if form is None or form.last_game_date != pd.Timestamp(last_game_date).strftime('%Y-%m-%d'):
+            return {f"L{n}": None for n in TREND_WINDOWS}
+        return form.trends()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w") as f:
+            json.dump({player_id: form.to_json() for player_id, form in self.players.items()}, f)
+
+
+_default_store: Optional[RollingFormStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_rolling_form_store() -> RollingFormStore:
+    """
+    Returns the process-wide rolling form store, loaded from ROLLING_FORM_PATH on first use.
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = RollingFormStore()
+        return _default_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the persisted L10/L30/L50 AAS form with newly played games.")
+    parser.add_argument(
+        "--date-from",
+        help="First game date to pull (YYYY-MM-DD). Defaults to the latest stored game date; "
+             "an empty store is seeded from the start of the season.",
+    )
+    parser.add_argument("--store", default=str(ROLLING_FORM_PATH), help="Path of the rolling form JSON store.")
+    args = parser.parse_args()
+
+    store = RollingFormStore(args.store)
+    date_from = args.date_from
+    if date_from is None:
+        # Inclusive: games on the latest date that were not final at the last run are picked up now
+        date_from = store.latest_game_date()
+    gamelog = make_api_request(
+        leaguegamelog.LeagueGameLog,
+        season=get_current_season(),
+        player_or_team_abbreviation='P',
+        date_from_nullable=datetime.strptime(date_from, "%Y-%m-%d").strftime("%m/%d/%Y") if date_from else "",
+    )
+    if gamelog is None:
+        raise SystemExit("Could not fetch the league game log.")
+
+    updated = store.apply_game_log(gamelog.get_data_frames()[0])
+    store.save()
+    print(f"Updated rolling form for {len(updated)} players since {date_from or 'the start of the season'}; saved to {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+League schedule tables with rest-day and schedule-density flags.
+
+Every team-game (from the nba_db `game` table, or csv/game_info.csv joined to
+csv/other_stats.csv for the home/away team ids) and every player-game (from
+the local game-log store) gets:
+
+    REST_DAYS   days off since the previous game (0 = back-to-back, NaN = first game)
+    IS_B2B      played the day before
+    IS_3_IN_4   third game in four days
+    IS_4_IN_6   fourth game in six days
+
+Flags come from grouped shifts of the sorted game dates, so the whole league
+is computed in a handful of vectorized passes. The tables are written to
+data/cache/schedule/ and downstream code joins to them on (TEAM_ID, GAME_ID)
+or (PLAYER_ID, GAME_ID) with join_schedule instead of re-deriving gaps; the
+AAS scripts do so via add_schedule_flags, and players with games newer than
+the table fall back to schedule_flags.
+
+Usage:
+    python -m src.projections.schedule              # rebuild both tables from every stored season
+    python -m src.projections.schedule --seasons 2023-24 2024-25 --db path/to/nba.sqlite
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .game_log_store import COLUMN_ALIASES, GameLogStore, normalize_game_ids
+
+CSV_DIR = Path(__file__).resolve().parents[2] / "csv"
+NBA_DB_PATH = Path(__file__).resolve().parent / "nba_db" / "nba.sqlite"
+SCHEDULE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "schedule"
+TEAM_SCHEDULE_PATH = SCHEDULE_DIR / "team_games.parquet"
+PLAYER_SCHEDULE_PATH = SCHEDULE_DIR / "player_games.parquet"
+
+SCHEDULE_FLAGS = ["REST_DAYS", "IS_B2B", "IS_3_IN_4", "IS_4_IN_6"]
+SCHEDULE_KEYS = ["PLAYER_ID", "GAME_ID"]
+
+_loaded: Dict[Path, Tuple[int, pd.DataFrame]] = {}
+_loaded_lock = threading.Lock()
+
+
+def schedule_flags(df: pd.DataFrame, by: Optional[str] = None, date_col: str = 'GAME_DATE') -> pd.DataFrame:
+    """
+    Rest days and density flags for each row of df, grouped by `by` (the whole frame is one group when None).
+    Returned frame is aligned to df.index; df does not need to be sorted.
+    """
+    dates = pd.to_datetime(df[date_col]).dt.normalize()
+    keys = df[by] if by is not None else pd.Series(0, index=df.index)
+    order = np.lexsort((dates.to_numpy(), keys.to_numpy()))
+    sorted_dates = dates.iloc[order]
+    grouped = sorted_dates.groupby(keys.iloc[order].to_numpy())
+
+    days_since = lambda k: (sorted_dates - grouped.shift(k)).dt.days
+    gap = days_since(1)
+    flags = pd.DataFrame({
+        'REST_DAYS': gap - 1,
+        'IS_B2B': gap == 1,
+        'IS_3_IN_4': days_since(2) <= 3,
+        'IS_4_IN_6': days_since(3) <= 5,
+    }, index=sorted_dates.index)
+    return flags.reindex(df.index)
+
+
+def load_team_games(db_path: Path | str = NBA_DB_PATH, csv_dir: Path | str = CSV_DIR) -> pd.DataFrame:
+    """
+    One row per team per game (GAME_ID, GAME_DATE, TEAM_ID), from the nba_db `game` table when populated.
+    """
+    games = None
+    db_path = Path(db_path)
+    if db_path.exists() and db_path.stat().st_size:
+        with sqlite3.connect(db_path) as conn:
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'game'").fetchone():
+                games = pd.read_sql("SELECT game_id, game_date, team_id_home, team_id_away FROM game", conn)
+
+    if games is None:
+        csv_dir = Path(csv_dir)
+        game_info = pd.read_csv(csv_dir / "game_info.csv", usecols=["game_id", "game_date"], dtype={"game_id": str})
+        teams = pd.read_csv(csv_dir / "other_stats.csv", usecols=["game_id", "team_id_home", "team_id_away"], dtype={"game_id": str})
+        games = game_info.merge(teams.drop_duplicates("game_id"), on="game_id")
+
+    team_games = games.melt(
+        id_vars=["game_id", "game_date"], value_vars=["team_id_home", "team_id_away"], value_name="TEAM_ID"
+    )
+    team_games = team_games.rename(columns={"game_id": "GAME_ID", "game_date": "GAME_DATE"})
+    team_games['GAME_ID'] = normalize_game_ids(team_games['GAME_ID'])
+    team_games['TEAM_ID'] = team_games['TEAM_ID'].astype(int)
+    team_games['GAME_DATE'] = pd.to_datetime(team_games['GAME_DATE'])
+    return team_games[['GAME_ID', 'GAME_DATE', 'TEAM_ID']].drop_duplicates(['GAME_ID', 'TEAM_ID'], ignore_index=True)
+
+
+def build_team_schedule(team_games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Team-game schedule table keyed by (TEAM_ID, GAME_ID).
+    """
+    return pd.concat([team_games, schedule_flags(team_games, 'TEAM_ID')], axis=1)
+
+
+def build_player_schedule(game_logs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Player-game schedule table keyed by (PLAYER_ID, GAME_ID), from a stacked multi-player game log.
+    """
+    player_games = game_logs[['PLAYER_ID', 'GAME_ID', 'GAME_DATE']].drop_duplicates(['PLAYER_ID', 'GAME_ID'], ignore_index=True)
+    return pd.concat([player_games, schedule_flags(player_games, 'PLAYER_ID')], axis=1)
+
+
+def join_schedule(df: pd.DataFrame, schedule: pd.DataFrame, on: Sequence[str]) -> pd.DataFrame:
+    """
+    Left-joins the schedule flags onto df, keeping df's index. Groups (on[0]) with games missing
+    from the schedule, e.g. played after the table was built, get their flags from schedule_flags.
+    """
+    on = list(on)
+    flags = schedule[on + SCHEDULE_FLAGS]
+    left = df.drop(columns=SCHEDULE_FLAGS, errors='ignore')
+    if 'GAME_ID' in on:
+        # Stores ingested from CSV and older tables may hold integer ids; compare in the API's string form
+        left = left.assign(GAME_ID=normalize_game_ids(left['GAME_ID']))
+        flags = flags.assign(GAME_ID=normalize_game_ids(flags['GAME_ID']))
+    merged = left.merge(flags, on=on, how='left', indicator=True)
+    merged.index = df.index
+    missing = merged.pop('_merge') == 'left_only'
+    if missing.any():
+        stale = df[on[0]].isin(df.loc[missing, on[0]])
+        recomputed = schedule_flags(df[stale], on[0]).reindex(df.index)
+        for flag in SCHEDULE_FLAGS:
+            merged[flag] = merged[flag].where(~stale, recomputed[flag])
+    merged['REST_DAYS'] = merged['REST_DAYS'].astype(float)
+    for flag in SCHEDULE_FLAGS[1:]:
+        merged[flag] = merged[flag].fillna(False).astype(bool)
+    return merged
+
+
+def schedule_version(path: Path | str = PLAYER_SCHEDULE_PATH) -> Optional[int]:
+    """
+    mtime of the schedule table, or None if it has not been built; used in result cache keys.
+    """
+    path = Path(path)
+    return path.stat().st_mtime_ns if path.exists() else None
+
+
+def load_schedule(path: Path | str = PLAYER_SCHEDULE_PATH) -> Optional[pd.DataFrame]:
+    """
+    Reads a schedule table written by main(), or None if it has not been built.
+    The table is kept in memory and only re-read when the file changes.
+    """
+    path = Path(path)
+    version = schedule_version(path)
+    if version is None:
+        return None
+    with _loaded_lock:
+        cached = _loaded.get(path)
+        if cached is None or cached[0] != version:
+            cached = _loaded[path] = (version, pd.read_parquet(path))
+    return cached[1]
+
+
+def add_schedule_flags(df: pd.DataFrame, schedule: Optional[pd.DataFrame] = None, by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Sets SCHEDULE_FLAGS on a game log: joined from the player-game schedule table on (PLAYER_ID, GAME_ID)
+    when one is given and df carries those ids (either casing), otherwise computed with schedule_flags(df, by).
+    """
+    ids = df.rename(columns=COLUMN_ALIASES)
+    if schedule is not None and set(SCHEDULE_KEYS) <= set(ids.columns):
+        joined = join_schedule(ids[SCHEDULE_KEYS + ['GAME_DATE']], schedule, SCHEDULE_KEYS)
+        df[SCHEDULE_FLAGS] = joined[SCHEDULE_FLAGS]
+    else:
+        df[SCHEDULE_FLAGS] = schedule_flags(df, by)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the league team-game and player-game schedule tables.")
+    parser.add_argument("--db", default=str(NBA_DB_PATH), help="nba_db SQLite file holding the `game` table.")
+    parser.add_argument("--seasons", nargs="*", help="Store seasons used for the player-game table (defaults to all stored seasons).")
+    args = parser.parse_args()
+
+    SCHEDULE_DIR.mkdir(parents=True, exist_ok=True)
+    team_schedule = build_team_schedule(load_team_games(args.db))
+    team_schedule.to_parquet(TEAM_SCHEDULE_PATH, index=False)
+    print(f"Wrote {len(team_schedule)} team-games ({team_schedule['IS_B2B'].mean():.1%} back-to-backs) to {TEAM_SCHEDULE_PATH}")
+
+    store = GameLogStore()
+    seasons: List[str] = args.seasons or store.seasons()
+    frames = [store.read_season(season, ['PLAYER_ID', 'GAME_ID', 'GAME_DATE']) for season in seasons]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        print("No seasons in the game-log store; skipped the player-game table.")
+        return
+    player_schedule = build_player_schedule(pd.concat(frames, ignore_index=True))
+    player_schedule.to_parquet(PLAYER_SCHEDULE_PATH, index=False)
+    print(f"Wrote {len(player_schedule)} player-games ({player_schedule['IS_B2B'].mean():.1%} back-to-backs) to {PLAYER_SCHEDULE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Declarative fantasy scoring systems compiled into one columnar pass.
+
+Systems are defined in data/scoring_systems.json as per-stat weights plus an
+optional double-digit bonus: each tier [n, points] adds `points` when at least
+n of the bonus stats reach the threshold, and tiers are cumulative (the AAS
+triple-double point is awarded on top of the double-double point).
+
+All selected systems are compiled into a single weight matrix, so scoring a
+frame under several systems is one matrix product plus one double-digit count
+per distinct bonus definition.
+
+Usage:
+    python -m src.projections.scoring data/game_logs/game_log_2023-24.csv --systems aas sorare draftkings
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+SCORING_CONFIG_PATH = Path(__file__).resolve().parents[2] / "data" / "scoring_systems.json"
+
+
+@dataclass(frozen=True)
+class ScoringSystem:
+    name: str
+    weights: Tuple[Tuple[str, float], ...]
+    bonus_stats: Tuple[str, ...] = ()
+    bonus_threshold: float = 10.0
+    bonus_tiers: Tuple[Tuple[int, float], ...] = ()
+    description: str = ""
+
+    @property
+    def column(self) -> str:
+        return self.name.upper()
+
+    @classmethod
+    def from_config(cls, name: str, config: Dict[str, object]) -> "ScoringSystem":
+        bonus = config.get("bonus") or {}
+        return cls(
+            name=name,
+            weights=tuple((stat, float(weight)) for stat, weight in config["weights"].items()),
+            bonus_stats=tuple(bonus.get("stats", ())),
+            bonus_threshold=float(bonus.get("threshold", 10)),
+            bonus_tiers=tuple((int(count), float(points)) for count, points in bonus.get("tiers", ())),
+            description=config.get("description", ""),
+        )
+
+
+def load_scoring_systems(path: Path | str = SCORING_CONFIG_PATH) -> Dict[str, ScoringSystem]:
+    """
+    Loads every scoring system defined in the config file, keyed by name.
+    """
+    with Path(path).open() as f:
+        config = json.load(f)
+    return {name: ScoringSystem.from_config(name, system) for name, system in config.items()}
+
+
+class CompiledScoring:
+    """
+    Several scoring systems lowered to a (stats x systems) weight matrix and grouped bonus rules.
+    """
+
+    def __init__(self, systems: Sequence[ScoringSystem]):
+        if not systems:
+            raise ValueError("At least one scoring system is required.")
+        self.systems = list(systems)
+        self.stats: List[str] = sorted({stat for system in self.systems for stat, _ in system.weights})
+        stat_index = {stat: i for i, stat in enumerate(self.stats)}
+
+        self.weights = np.zeros((len(self.stats), len(self.systems)))
+        self._bonus_groups: Dict[Tuple[Tuple[str, ...], float], List[Tuple[int, Tuple[Tuple[int, float], ...]]]] = {}
+        for j, system in enumerate(self.systems):
+            for stat, weight in system.weights:
+                self.weights[stat_index[stat], j] = weight
+            if system.bonus_stats and system.bonus_tiers:
+                key = (system.bonus_stats, system.bonus_threshold)
+                self._bonus_groups.setdefault(key, []).append((j, system.bonus_tiers))
+
+    @property
+    def columns(self) -> List[str]:
+        return [system.column for system in self.systems]
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Stable hash of the compiled definitions, for cache keys.
+        """
+        payload = json.dumps([(s.name, s.weights, s.bonus_stats, s.bonus_threshold, s.bonus_tiers) for s in self.systems])
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def score(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scores every row of a game-log frame under every compiled system; one column per system.
+        """
+        scores = df[self.stats].to_numpy(dtype=float) @ self.weights
+        for (bonus_stats, threshold), entries in self._bonus_groups.items():
+            double_digit_stats = (df[list(bonus_stats)].to_numpy(dtype=float) >= threshold).sum(axis=1)
+            for j, tiers in entries:
+                for min_count, points in tiers:
+                    scores[:, j] += (double_digit_stats >= min_count) * points
+        return pd.DataFrame(scores, index=df.index, columns=self.columns)
+
+
+def compile_scoring_systems(names: Optional[Sequence[str]] = None, path: Path | str = SCORING_CONFIG_PATH) -> CompiledScoring:
+    """
+    Compiles the named systems from the config file (all of them when names is None).
+    """
+    systems = load_scoring_systems(path)
+    if names is None:
+        names = list(systems)
+    missing = [name for name in names if name not in systems]
+    if missing:
+        raise ValueError(f"Unknown scoring system(s): {', '.join(missing)}. Available: {', '.join(systems)}")
+    return CompiledScoring([systems[name] for name in names])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a game-log CSV under several fantasy scoring systems in one pass.")
+    parser.add_argument("input_file", help="Game-log CSV with nba_api box score columns (PTS, REB, AST, ...).")
+    parser.add_argument("--systems", nargs="+", help="Scoring systems to compare (defaults to every configured system).")
+    parser.add_argument("--config", default=str(SCORING_CONFIG_PATH), help="Path to the scoring systems JSON file.")
+    parser.add_argument("--output", help="Optional CSV path for the per-game scores.")
+    args = parser.parse_args()
+
+    compiled = compile_scoring_systems(args.systems, args.config)
+    games = pd.read_csv(args.input_file)
+    scores = compiled.score(games)
+
+    print(f"Scored {len(scores)} games under: {', '.join(compiled.columns)}")
+    print("\n--- Mean Score per Game ---")
+    print(scores.mean().to_string(float_format=lambda value: f"{value:.2f}"))
+    print("\n--- Correlation Between Systems ---")
+    print(scores.corr().to_string(float_format=lambda value: f"{value:.3f}"))
+
+    if args.output:
+        pd.concat([games, scores], axis=1).to_csv(args.output, index=False)
+        print(f"\nScores saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
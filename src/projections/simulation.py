@@ -0,0 +1,251 @@
+"""
+Monte Carlo outcome distributions for the player_game projection.
+
+Instead of the fixed `max(5, sorare_std * 1.2)` band, each player's game is
+simulated as
+
+    score = minutes * per-minute production * efficiency multiplier
+
+with minutes drawn around the projected minutes, per-minute production
+(Sorare points per minute at the player's average efficiency) drawn from a
+lognormal, and the efficiency multiplier drawn around the projected true
+shooting. Spreads are fitted to each player's recent games; production is
+then scaled so each player's simulated mean equals the project_slate
+expected score, so the point estimate and the quantiles agree. Every player
+on a slate is drawn at once as (players x draws) NumPy arrays, in batches
+that bound peak memory, and summarised as floor / median / ceiling
+quantiles and P(score > threshold).
+
+All players share one set of random shocks, so outcomes are perfectly
+correlated across players: the results describe each player on their own
+and must not be summed or combined into lineup totals.
+
+Usage:
+    python -m src.projections.simulation data/game_logs/lebron_james.csv --threshold 40 --threshold 50
+    python -m src.projections.simulation data/game_logs/*.csv --draws 100000 --output outputs/simulation.csv
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .context_store import get_context_store
+from .feature_cache import FeatureCache, load_many_features, report_skipped
+from .player_game import FeatureFrame, project_slate, write_csv
+
+SIMULATION_DRAWS = 20_000
+SIMULATION_HISTORY = 20
+QUANTILES = (0.1, 0.5, 0.9)
+MAX_MINUTES = 48.0
+MIN_MINUTES_STD = 2.0
+DEFAULT_RATE_LOG_STD = 0.25
+_MAX_BATCH_CELLS = 4_000_000
+
+
+@dataclass
+class SimulationResult:
+    player_id: str
+    draws: int
+    mean_score: float
+    floor: float
+    median: float
+    ceiling: float
+    prob_over: Dict[float, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, float]:
+        row = {key: value for key, value in self.__dict__.items() if key != "prob_over"}
+        row.update({f"p_over_{threshold:g}": prob for threshold, prob in self.prob_over.items()})
+        return row
+
+
+def _recent(features: FeatureFrame | List[Dict[str, float]], key: str, history: int) -> np.ndarray:
+    if isinstance(features, FeatureFrame):
+        return features.column(key)[-history:].astype(float)
+    return np.array([row.get(key) for row in features[-history:]], dtype=float)
+
+
+def _nan_moments(values: np.ndarray) -> tuple:
+    """Row-wise count, mean and population std of a NaN-padded matrix, without all-NaN warnings."""
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=1)
+    filled = np.where(valid, values, 0.0)
+    safe_count = np.maximum(count, 1)
+    mean = np.where(count > 0, filled.sum(axis=1) / safe_count, np.nan)
+    centred = np.where(valid, values - mean[:, None], 0.0)
+    std = np.where(count > 0, np.sqrt((centred ** 2).sum(axis=1) / safe_count), np.nan)
+    return count, mean, std
+
+
+def fit_distributions(feature_sets: List[FeatureFrame | List[Dict[str, float]]], history: int = SIMULATION_HISTORY) -> Dict[str, np.ndarray]:
+    """Per-player spreads from the last `history` games: minutes, log per-minute production, true shooting, usage."""
+    series = {key: np.full((len(feature_sets), history), np.nan) for key in ("minutes", "sorare_score", "true_shooting_pct", "usage_rate")}
+    for idx, features in enumerate(feature_sets):
+        for key, matrix in series.items():
+            values = _recent(features, key, history)
+            matrix[idx, history - len(values):] = values
+
+    minutes, score, ts = series["minutes"], series["sorare_score"], series["true_shooting_pct"]
+    _, minutes_mean, minutes_std = _nan_moments(minutes)
+    _, ts_mean, ts_std = _nan_moments(ts)
+    _, usage_mean, _ = _nan_moments(series["usage_rate"])
+
+    # Production per minute at the player's average efficiency; games without a positive rate are left out
+    efficiency = np.where(np.isnan(ts) | ~(ts_mean[:, None] > 0), 1.0, ts / ts_mean[:, None])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = score / minutes / efficiency
+        log_rate = np.where((minutes > 0) & (rate > 0), np.log(rate), np.nan)
+    rate_count, log_rate_mean, log_rate_std = _nan_moments(log_rate)
+
+    return {
+        "minutes_std": minutes_std,
+        "ts_mean": ts_mean,
+        "ts_std": ts_std,
+        "usage_mean": usage_mean,
+        "log_rate_mean": log_rate_mean,
+        "log_rate_std": np.where(rate_count >= 2, log_rate_std, DEFAULT_RATE_LOG_STD),
+    }
+
+
+def _simulate_batch(
+    shocks: np.ndarray,
+    minutes_mu: np.ndarray,
+    minutes_sigma: np.ndarray,
+    log_rate_mu: np.ndarray,
+    log_rate_sigma: np.ndarray,
+    efficiency_mu: np.ndarray,
+    efficiency_sigma: np.ndarray,
+) -> np.ndarray:
+    column = lambda values: values.astype(np.float32)[:, None]
+    minutes = np.clip(column(minutes_mu) + column(minutes_sigma) * shocks[0], 0.0, MAX_MINUTES)
+    rate = np.exp(column(log_rate_mu) + column(log_rate_sigma) * shocks[1])
+    efficiency = np.maximum(column(efficiency_mu) + column(efficiency_sigma) * shocks[2], 0.0)
+    return minutes * rate * efficiency
+
+
+def simulate_slate(
+    feature_sets: List[FeatureFrame | List[Dict[str, float]]],
+    contexts: List[Dict[str, float | str]],
+    draws: int = SIMULATION_DRAWS,
+    thresholds: Sequence[float] = (),
+    seed: Optional[int] = None,
+    as_table: bool = False,
+) -> List[SimulationResult] | Dict[str, np.ndarray]:
+    """Simulate every player on a slate around their project_slate projection.
+
+    Each player's draws are scaled so their mean equals the projection's expected_score
+    (players projected for no minutes score 0). Results are per-player marginals only; see
+    the module docstring on shared shocks. Returns one SimulationResult per player, or a
+    columnar table (player_id, draws, mean_score, floor, median, ceiling,
+    p_over_<threshold>) when as_table is True.
+    """
+    if draws < 1:
+        raise ValueError("Simulation needs at least one draw.")
+    projection = project_slate(feature_sets, contexts, as_table=True)
+    fitted = fit_distributions(feature_sets)
+    n = len(feature_sets)
+
+    expected_minutes = projection["expected_minutes"]
+    expected_score = projection["expected_score"]
+    minutes_sigma = np.where(expected_minutes > 0, np.maximum(np.nan_to_num(fitted["minutes_std"]), MIN_MINUTES_STD), 0.0)
+
+    # Projected usage and efficiency shift the historical production; players without usable
+    # history fall back to the deterministic projection's points per minute. The location is
+    # anchored to expected_score after drawing, so these mostly shape the spread
+    usage_ratio = np.where(fitted["usage_mean"] > 0, projection["expected_usage"] / fitted["usage_mean"], 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fallback_rate = np.log(expected_score / expected_minutes)
+    log_rate_mu = np.where(np.isnan(fitted["log_rate_mean"]), fallback_rate, fitted["log_rate_mean"] + np.log(np.where(usage_ratio > 0, usage_ratio, 1.0)))
+    log_rate_mu = np.nan_to_num(log_rate_mu, nan=-np.inf, posinf=-np.inf)
+    has_ts = fitted["ts_mean"] > 0
+    efficiency_mu = np.where(has_ts, np.nan_to_num(projection["expected_efficiency"] / np.where(has_ts, fitted["ts_mean"], 1.0), nan=1.0), 1.0)
+    efficiency_sigma = np.where(has_ts, np.nan_to_num(fitted["ts_std"] / np.where(has_ts, fitted["ts_mean"], 1.0)), 0.0)
+
+    # One set of standard-normal shocks is shared by every player (common random numbers): each
+    # player's draws are still independent, and the slate costs 3 x draws normals instead of
+    # 3 x n x draws, but players are perfectly correlated with each other
+    shocks = np.random.default_rng(seed).standard_normal((3, draws)).astype(np.float32)
+    thresholds = list(thresholds)
+    summary = {key: np.empty(n) for key in ("mean_score", "floor", "median", "ceiling")}
+    prob_over = np.empty((len(thresholds), n))
+    batch = max(1, _MAX_BATCH_CELLS // draws)
+    for start in range(0, n, batch):
+        part = slice(start, min(start + batch, n))
+        scores = _simulate_batch(
+            shocks, expected_minutes[part], minutes_sigma[part], log_rate_mu[part],
+            fitted["log_rate_std"][part], efficiency_mu[part], efficiency_sigma[part],
+        )
+        sample_mean = scores.mean(axis=1, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(sample_mean > 0, np.maximum(expected_score[part], 0.0) / sample_mean, 1.0)
+        scores *= np.nan_to_num(scale, nan=1.0).astype(np.float32)[:, None]
+        summary["mean_score"][part] = scores.mean(axis=1, dtype=np.float64)
+        summary["floor"][part], summary["median"][part], summary["ceiling"][part] = np.quantile(scores, QUANTILES, axis=1)
+        for position, threshold in enumerate(thresholds):
+            prob_over[position, part] = (scores > threshold).mean(axis=1)
+
+    table = {"player_id": projection["player_id"], "draws": np.full(n, draws), **summary}
+    table.update({f"p_over_{threshold:g}": prob_over[position] for position, threshold in enumerate(thresholds)})
+    if as_table:
+        return table
+    return [
+        SimulationResult(
+            player_id=table["player_id"][idx],
+            draws=draws,
+            prob_over={threshold: float(prob_over[position, idx]) for position, threshold in enumerate(thresholds)},
+            **{key: float(summary[key][idx]) for key in summary},
+        )
+        for idx in range(n)
+    ]
+
+
+def simulate_player_game(
+    features: FeatureFrame | List[Dict[str, float]],
+    context: Dict[str, float | str],
+    draws: int = SIMULATION_DRAWS,
+    thresholds: Sequence[float] = (),
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """Simulate one player's upcoming game; see simulate_slate."""
+    if not features:
+        raise ValueError("Feature set is empty; cannot simulate player.")
+    return simulate_slate([features], [context], draws, thresholds, seed)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo outcome distributions for upcoming player games.")
+    parser.add_argument("game_logs", nargs="+", help="Checklist-schema game log CSVs, one per player (file stem = player_id).")
+    parser.add_argument("--context", default="data/upcoming_game_context.csv", help="Upcoming game context CSV.")
+    parser.add_argument("--draws", type=int, default=SIMULATION_DRAWS, help="Simulated games per player.")
+    parser.add_argument("--threshold", type=float, action="append", default=[], help="Report P(score > threshold); repeatable.")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible draws.")
+    parser.add_argument("--output", help="Optional CSV path for the per-player summaries.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-engineer features instead of using the feature cache.")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else FeatureCache()
+
+    loaded = load_many_features(args.game_logs, SIMULATION_HISTORY, cache, on_error=report_skipped)
+    player_ids = [player_id for player_id, features in loaded.items() if len(features)]
+    feature_sets = [loaded[player_id] for player_id in player_ids]
+    known = get_context_store(args.context).bulk(player_ids) if Path(args.context).exists() else {}
+    contexts = [known.get(player_id, {"player_id": player_id}) for player_id in player_ids]
+
+    results = simulate_slate(feature_sets, contexts, args.draws, args.threshold, args.seed)
+    header = f"{'player':<30} {'mean':>7} {'floor':>7} {'median':>7} {'ceiling':>7}" + "".join(f" {'>' + format(t, 'g'):>7}" for t in args.threshold)
+    print(header)
+    for result in results:
+        probs = "".join(f" {prob:>7.1%}" for prob in result.prob_over.values())
+        print(f"{result.player_id:<30} {result.mean_score:>7.1f} {result.floor:>7.1f} {result.median:>7.1f} {result.ceiling:>7.1f}{probs}")
+
+    if args.output and results:
+        rows = [result.to_dict() for result in results]
+        write_csv(args.output, rows, list(rows[0].keys()))
+        print(f"\nSimulation summaries saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+On-disk cache of league standings keyed by season.
+
+Completed seasons never change, so a copy fetched after the season ended is
+kept forever; a copy cached while the season was still running is refetched
+once, after which it is final. The current season is refetched once its
+cached copy is older than the TTL.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+from nba_api.stats.endpoints import leaguestandings
+
+from .nba_api_client import make_api_request
+from .team_index import TEAM_INDEX
+
+STANDINGS_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "standings"
+DEFAULT_TTL_HOURS = 12.0
+# (month, day) of the year after a season starts by which its playoffs are over
+SEASON_END = (7, 1)
+
+
+def get_current_season() -> str:
+    """
+    Gets the season string (e.g. 2025-26) for the season in progress.
+    """
+    now = datetime.now()
+    start_year = now.year if now.month >= 10 else now.year - 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def get_last_n_seasons(n: int) -> List[str]:
+    """
+    Gets a list of the last n season strings, most recent first.
+    """
+    start_year = int(get_current_season()[:4])
+    return [f"{year}-{(year + 1) % 100:02d}" for year in range(start_year, start_year - n, -1)]
+
+
+def season_end(season: str) -> datetime:
+    """
+    Gets the date by which a season (e.g. 2023-24), playoffs included, has finished.
+    """
+    return datetime(int(season[:4]) + 1, *SEASON_END)
+
+
+class StandingsCache:
+    """
+    Season-keyed standings cache backed by one CSV per season.
+    """
+
+    def __init__(self, cache_dir: Path | str = STANDINGS_CACHE_DIR, ttl_hours: float = DEFAULT_TTL_HOURS):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_hours * 3600
+        self._memory: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, season: str) -> Path:
+        return self.cache_dir / f"{season}.csv"
+
+    def _is_fresh(self, season: str, path: Path) -> bool:
+        if not path.exists():
+            return False
+        fetched = path.stat().st_mtime
+        if season != get_current_season():
+            # Only a copy fetched after the season ended holds final win percentages
+            return fetched >= season_end(season).timestamp()
+        return time.time() - fetched < self.ttl_seconds
+
+    def get(self, season: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the standings for a season, fetching them only when the cached copy is missing or stale.
+        """
+        path = self._path(season)
+        with self._lock:
+            if season in self._memory and self._is_fresh(season, path):
+                return self._memory[season]
+
+            if self._is_fresh(season, path):
+                df = pd.read_csv(path)
+            else:
+                standings = make_api_request(leaguestandings.LeagueStandings, season=season)
+                if standings is None:
+                    return None
+                df = standings.get_data_frames()[0]
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                df.to_csv(path, index=False)
+
+            self._memory[season] = df
+            return df
+
+    def version(self, season: str) -> Optional[int]:
+        """
+        Modification time of the season's cached standings, refreshing them first if stale.
+        """
+        if self.get(season) is None:
+            return None
+        path = self._path(season)
+        return path.stat().st_mtime_ns if path.exists() else None
+
+
+_default_cache: Optional[StandingsCache] = None
+
+
+def get_standings_cache(ttl_hours: Optional[float] = None) -> StandingsCache:
+    """
+    Returns the process-wide standings cache, optionally overriding its TTL.
+    """
+    global _default_cache
+    if _default_cache is None:
+        ttl = ttl_hours if ttl_hours is not None else float(os.environ.get("STANDINGS_TTL_HOURS", DEFAULT_TTL_HOURS))
+        _default_cache = StandingsCache(ttl_hours=ttl)
+    elif ttl_hours is not None:
+        _default_cache.ttl_seconds = ttl_hours * 3600
+    return _default_cache
+
+
+def get_win_percentage_table(seasons: List[str], ttl_hours: Optional[float] = None) -> pd.DataFrame:
+    """
+    Gets a long (SEASON, OPPONENT, OPPONENT_WIN_PCT) table of team win percentages for a list of seasons.
+    """
+    cache = get_standings_cache(ttl_hours)
+    frames = []
+    for season in seasons:
+        standings = cache.get(season)
+        if standings is None:
+            continue
+        frames.append(pd.DataFrame({
+            "SEASON": season,
+            "OPPONENT": standings['TeamID'].map(TEAM_INDEX.id_to_abbreviation),
+            "OPPONENT_WIN_PCT": standings['WinPCT'],
+        }))
+    if not frames:
+        return pd.DataFrame(columns=["SEASON", "OPPONENT", "OPPONENT_WIN_PCT"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def get_team_win_percentages(seasons: List[str], ttl_hours: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Gets the win percentages for all teams for a list of seasons.
+    """
+    table = get_win_percentage_table(seasons, ttl_hours)
+    return {
+        season: dict(zip(season_table['OPPONENT'], season_table['OPPONENT_WIN_PCT']))
+        for season, season_table in table.groupby('SEASON', sort=False)
+    }
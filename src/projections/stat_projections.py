@@ -0,0 +1,62 @@
+"""
+League-wide individual stat projections from a stacked multi-player game log.
+
+Each Projected_<STAT> is a weighted blend of a player's mean over several
+recent-game windows. Windows are given as {n_games: weight}, with None meaning
+the player's whole history; the default reproduces the original
+00_playercheck.py projection (0.5 * long-term mean + 0.5 * last-10 mean).
+Every window is one masked groupby mean over all players, so the cost does
+not grow with a per-player Python loop.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+
+PROJECTED_STATS = ("PTS", "REB", "AST", "STL", "BLK", "TOV", "FG3M")
+DEFAULT_WINDOW_WEIGHTS: Dict[Optional[int], float] = {None: 0.5, 10: 0.5}
+
+
+def parse_window_weights(spec: str) -> Dict[Optional[int], float]:
+    """
+    Parses "all:0.5,10:0.5" into {None: 0.5, 10: 0.5}.
+    """
+    weights: Dict[Optional[int], float] = {}
+    for part in spec.split(","):
+        window, _, weight = part.strip().partition(":")
+        if not weight:
+            raise ValueError(f"Expected <window>:<weight>, got '{part}'.")
+        weights[None if window.lower() == "all" else int(window)] = float(weight)
+    return weights
+
+
+def project_stats(
+    game_logs: pd.DataFrame,
+    window_weights: Optional[Dict[Optional[int], float]] = None,
+    stats: Sequence[str] = PROJECTED_STATS,
+    by: str = "PLAYER_ID",
+) -> pd.DataFrame:
+    """
+    Projects each player's stats from their windowed means; one row per player, Projected_<STAT> columns.
+    A window longer than a player's history averages every game they have, like DataFrame.head(n).
+    """
+    window_weights = window_weights or DEFAULT_WINDOW_WEIGHTS
+    stats = list(stats)
+    columns = [f"Projected_{stat}" for stat in stats]
+    if game_logs.empty:
+        return pd.DataFrame(columns=columns)
+
+    df = game_logs[[by, 'GAME_DATE', *stats]].copy()
+    df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'])
+    df = df.sort_values([by, 'GAME_DATE'], ascending=[True, False], kind='stable')
+    game_number = df.groupby(by).cumcount()
+
+    projections = None
+    for window, weight in window_weights.items():
+        values = df[stats] if window is None else df[stats].where(game_number < window)
+        means = values.groupby(df[by]).mean() * weight
+        projections = means if projections is None else projections + means
+
+    projections.columns = columns
+    return projections
@@ -0,0 +1,144 @@
+"""
+Team dimension table with O(1) lookups between team ids, abbreviations and slugs.
+
+Built once at import time from csv/team.csv (falling back to nba_api static data),
+with historical abbreviations from csv/team_abbreviations.csv and historical
+city/nickname slugs from csv/team_history.csv, so older MATCHUP strings such as
+"NJN" or "SEA" resolve to the current franchise.
+
+team_abbreviations.csv is a small precomputed extract of the box-score
+abbreviations in the 3.5 MB csv/other_stats.csv, so importing the index does
+not parse the full box-score file. Regenerate it after refreshing csv/:
+
+    python -m src.projections.team_index
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CSV_DIR = Path(__file__).resolve().parents[2] / "csv"
+ABBREVIATIONS_FILE = "team_abbreviations.csv"
+
+
+def slugify(name: str) -> str:
+    """
+    Converts a team name to the dash-separated slug used by Sorare (e.g. philadelphia-76ers).
+    """
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+@dataclass
+class TeamIndex:
+    id_to_abbreviation: Dict[int, str] = field(default_factory=dict)
+    id_to_name: Dict[int, str] = field(default_factory=dict)
+    abbreviation_to_id: Dict[str, int] = field(default_factory=dict)
+    slug_to_id: Dict[str, int] = field(default_factory=dict)
+
+    def abbreviation(self, team_id: int) -> Optional[str]:
+        return self.id_to_abbreviation.get(int(team_id))
+
+    def team_id(self, abbreviation: str) -> Optional[int]:
+        return self.abbreviation_to_id.get(abbreviation.strip().upper())
+
+    def team_id_for_slug(self, slug: str) -> Optional[int]:
+        return self.slug_to_id.get(slug)
+
+    def canonical_abbreviation(self, abbreviation: str) -> str:
+        """
+        Maps any current or historical abbreviation to the franchise's current one.
+        Unknown abbreviations are returned unchanged.
+        """
+        team_id = self.team_id(abbreviation)
+        if team_id is None:
+            return abbreviation
+        return self.id_to_abbreviation[team_id]
+
+    def canonical_abbreviations(self) -> Dict[str, str]:
+        """
+        Returns a mapping of every known abbreviation to the current one, for vectorized lookups.
+        """
+        return {abbreviation: self.id_to_abbreviation[team_id] for abbreviation, team_id in self.abbreviation_to_id.items()}
+
+
+def _read_csv(path: Path) -> List[Dict[str, str]]:
+    if not path.exists():
+        return []
+    with path.open(newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def historical_abbreviations(csv_dir: Path | str = CSV_DIR) -> List[Dict[str, str]]:
+    """
+    Distinct (abbreviation, team_id) pairs as they appear in csv/other_stats.csv box scores, in first-seen order.
+    """
+    pairs: Dict[Tuple[str, str], None] = {}
+    for row in _read_csv(Path(csv_dir) / "other_stats.csv"):
+        for side in ("home", "away"):
+            abbreviation = row[f"team_abbreviation_{side}"]
+            if abbreviation:
+                pairs.setdefault((abbreviation, row[f"team_id_{side}"]), None)
+    return [{"abbreviation": abbreviation, "team_id": team_id} for abbreviation, team_id in pairs]
+
+
+def load_team_index(csv_dir: Path | str = CSV_DIR) -> TeamIndex:
+    """
+    Builds the team lookup tables from the csv/ snapshot or nba_api static data.
+    """
+    csv_dir = Path(csv_dir)
+    index = TeamIndex()
+
+    team_rows = _read_csv(csv_dir / "team.csv")
+    if not team_rows:
+        from nba_api.stats.static import teams
+
+        team_rows = teams.get_teams()
+
+    for row in team_rows:
+        team_id = int(row["id"])
+        index.id_to_abbreviation[team_id] = row["abbreviation"]
+        index.id_to_name[team_id] = row["full_name"]
+        index.abbreviation_to_id[row["abbreviation"]] = team_id
+        index.slug_to_id[slugify(row["full_name"])] = team_id
+
+    # Historical abbreviations (NJN, SEA, NOH, VAN, ...) as they appear in box scores
+    abbreviation_rows = _read_csv(csv_dir / ABBREVIATIONS_FILE) or historical_abbreviations(csv_dir)
+    for row in abbreviation_rows:
+        team_id = int(row["team_id"])
+        if team_id in index.id_to_abbreviation:
+            index.abbreviation_to_id.setdefault(row["abbreviation"], team_id)
+
+    # Historical franchise names (seattle-supersonics, new-jersey-nets, ...)
+    for row in _read_csv(csv_dir / "team_history.csv"):
+        team_id = int(row["team_id"])
+        if team_id in index.id_to_abbreviation:
+            index.slug_to_id.setdefault(slugify(f"{row['city']} {row['nickname']}"), team_id)
+
+    return index
+
+
+TEAM_INDEX = load_team_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate csv/team_abbreviations.csv from csv/other_stats.csv.")
+    parser.add_argument("--csv-dir", default=str(CSV_DIR), help="Directory holding other_stats.csv.")
+    args = parser.parse_args()
+
+    rows = historical_abbreviations(args.csv_dir)
+    path = Path(args.csv_dir) / ABBREVIATIONS_FILE
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["abbreviation", "team_id"])
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Wrote {len(rows)} abbreviations to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from src.projections.context_store import UpcomingContextStore
+from src.projections.player_game import prepare_upcoming_context
+
+HEADER = "timestamp,player_id,player_name,injury_status,projected_minutes,matchup,pace_context,vegas_total,notes\n"
+
+
+def _row(player_id, minutes, timestamp="2025-11-09T12:00:00"):
+    return f"{timestamp},{player_id},{player_id.title()},,{minutes},A@B,100,220,\n"
+
+
+def test_appended_rows_replace_latest(tmp_path):
+    path = tmp_path / "context.csv"
+    path.write_text(HEADER + _row("a", 30))
+    store = UpcomingContextStore(path, keep_history=True)
+
+    with path.open("a") as f:
+        f.write(_row("a", 32, "2025-11-10T12:00:00") + _row("b", 25))
+    store.refresh()
+    assert store.get("a")["projected_minutes"] == 32.0
+    assert set(store.bulk()) == {"a", "b"}
+    assert len(store.history("a")) == 2
+
+
+def test_regenerated_file_is_reindexed(tmp_path):
+    path = tmp_path / "context.csv"
+    path.write_text(HEADER + _row("a", 30))
+    assert prepare_upcoming_context(path, "a")["projected_minutes"] == 30.0
+
+    # A regenerated snapshot that grew: the old offset no longer marks an append boundary
+    path.write_text(HEADER + _row("b", 25) + _row("c", 28))
+    assert prepare_upcoming_context(path, "b")["projected_minutes"] == 25.0
+
+
+def test_dropped_players_are_forgotten(tmp_path):
+    path = tmp_path / "context.csv"
+    path.write_text(HEADER + _row("a", 30) + _row("b", 25))
+    store = UpcomingContextStore(path)
+
+    path.write_text(HEADER + _row("b", 26) + _row("c", 28) + _row("d", 20))
+    store.refresh()
+    assert store.get("a") is None
+    assert store.get("b")["projected_minutes"] == 26.0
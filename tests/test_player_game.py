@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.projections import player_game
+
+HEADER = "game_date,opponent,minutes,usage_rate,true_shooting_pct,sorare_score,pace,opponent_def_rating\n"
+
+
+def _write_log(path, days, opponent="OPP"):
+    start = date(2024, 1, 1)
+    with path.open("w", newline="") as f:
+        f.write(HEADER)
+        for day in days:
+            f.write(f"{(start + timedelta(days=day - 1)).isoformat()},{opponent},30,25,0.55,{day},100,110\n")
+
+
+def _scores(rows):
+    return [int(row["sorare_score"]) for row in rows]
+
+
+@pytest.fixture(autouse=True)
+def index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(player_game, "GAME_LOG_INDEX_DIR", tmp_path / "index")
+
+
+def test_trailing_games_after_append(tmp_path):
+    path = tmp_path / "log.csv"
+    _write_log(path, range(1, 11))
+    assert _scores(player_game.load_game_logs(path, 3)) == [8, 9, 10]
+
+    with path.open("a") as f:
+        f.write(f"{date(2024, 1, 11).isoformat()},OPP,30,25,0.55,11,100,110\n")
+    assert _scores(player_game.load_game_logs(path, 3)) == [9, 10, 11]
+
+
+@pytest.mark.parametrize("opponent", ["OPP", "OPPONENT"])
+def test_rewritten_log_is_rescanned(tmp_path, opponent):
+    path = tmp_path / "log.csv"
+    _write_log(path, range(1, 11))
+    assert _scores(player_game.load_game_logs(path, 3)) == [8, 9, 10]
+
+    # A rewrite (not an append) that grows the file; with a longer opponent the old
+    # checked offset lands mid-line
+    _write_log(path, [1, 2, 3, 4, 5, 6, 7, 8, 20, 9, 21, 22], opponent)
+    assert _scores(player_game.load_game_logs(path, 3)) == [20, 21, 22]
+
+
+def test_rewrite_near_the_end_of_a_long_log_is_rescanned(tmp_path):
+    path = tmp_path / "log.csv"
+    _write_log(path, range(1, 501))
+    assert _scores(player_game.load_game_logs(path, 3)) == [498, 499, 500]
+
+    # Only the last checked rows change; the fingerprint window still covers them
+    _write_log(path, [*range(1, 499), 600, 499, 500, 601])
+    assert _scores(player_game.load_game_logs(path, 3)) == [500, 600, 601]
+
+
+def test_unwritable_index_is_not_an_error(tmp_path, monkeypatch):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(player_game, "GAME_LOG_INDEX_DIR", blocker / "index")
+    path = tmp_path / "log.csv"
+    _write_log(path, range(1, 11))
+    assert _scores(player_game.load_game_logs(path, 3)) == [8, 9, 10]
+
+
+def test_load_many_game_logs_reports_invalid_files(tmp_path):
+    good = tmp_path / "good.csv"
+    _write_log(good, range(1, 6))
+    bad = tmp_path / "bad.csv"
+    bad.write_bytes("game_date\n".encode("utf-16"))
+
+    skipped = []
+    logs = player_game.load_many_game_logs([bad, good], 2, on_error=lambda path, e: skipped.append(path))
+    assert {stem: _scores(rows) for stem, rows in logs.items()} == {"good": [4, 5]}
+    assert skipped == [bad]
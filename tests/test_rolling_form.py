@@ -0,0 +1,31 @@
+import pandas as pd
+
+from src.projections.rolling_form import RollingFormStore
+
+
+def _game_log(player_id, dates, aas):
+    return pd.DataFrame({"PLAYER_ID": player_id, "GAME_DATE": dates, "AAS": aas})
+
+
+def test_overlapping_pull_adds_late_games_once(tmp_path):
+    store = RollingFormStore(tmp_path / "rolling_form.json")
+    store.apply_game_log(_game_log(1, ["2025-10-21", "2025-10-22"], [10.0, 20.0]))
+
+    # Re-pulling from the latest stored date picks up a game that was not final last run
+    updated = store.apply_game_log(pd.concat([
+        _game_log(1, ["2025-10-22"], [20.0]),
+        _game_log(2, ["2025-10-22"], [30.0]),
+    ]))
+    assert updated == ["2"]
+    assert store.players["1"].games == 2
+    assert store.latest_game_date() == "2025-10-22"
+
+
+def test_trends_through_requires_a_current_store(tmp_path):
+    store = RollingFormStore(tmp_path / "rolling_form.json")
+    dates = pd.date_range("2025-01-01", periods=12).strftime("%Y-%m-%d")
+    store.apply_game_log(_game_log(1, dates, [float(i) for i in range(12)]))
+
+    assert store.trends_through(1, pd.Timestamp("2025-01-12"))["L10"] == sum(range(2, 12)) / 10
+    assert store.trends_through(1, "2025-01-13")["L10"] is None
+    assert store.trends_through(2, "2025-01-12")["L10"] is None
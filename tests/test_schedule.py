@@ -0,0 +1,27 @@
+import pandas as pd
+
+from src.projections.game_log_store import GameLogStore
+from src.projections.schedule import SCHEDULE_FLAGS, add_schedule_flags, build_player_schedule
+
+
+def test_csv_ingested_store_joins_api_game_ids(tmp_path):
+    # read_csv parses GAME_ID as int64; PlayerGameLog returns zero-padded strings
+    csv_path = tmp_path / "game_log.csv"
+    pd.DataFrame({
+        "PLAYER_ID": [1, 1, 1],
+        "GAME_ID": [22300001, 22300005, 22300009],
+        "GAME_DATE": ["2023-10-24", "2023-10-25", "2023-10-27"],
+    }).to_csv(csv_path, index=False)
+    store = GameLogStore(tmp_path / "store")
+    store.write_season("2023-24", pd.read_csv(csv_path))
+    schedule = build_player_schedule(store.read_season("2023-24"))
+
+    log = pd.DataFrame({
+        "Player_ID": [1, 1, 1],
+        "Game_ID": ["0022300009", "0022300005", "0022300001"],
+        "GAME_DATE": pd.to_datetime(["2023-10-27", "2023-10-25", "2023-10-24"]),
+    })
+    for table in (schedule, schedule.assign(GAME_ID=schedule["GAME_ID"].astype(int))):
+        flags = add_schedule_flags(log.copy(), table)[SCHEDULE_FLAGS]
+        assert flags["IS_B2B"].tolist() == [False, True, False]
+        assert flags["IS_3_IN_4"].tolist() == [True, False, False]
@@ -0,0 +1,26 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from src.projections.standings import StandingsCache
+
+
+def _cached_at(cache, season, when):
+    path = cache._path(season)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"TeamID": [1610612747], "WinPCT": [0.5]}).to_csv(path, index=False)
+    os.utime(path, (when.timestamp(), when.timestamp()))
+    return path
+
+
+def test_completed_season_cached_mid_season_is_refetched(tmp_path):
+    cache = StandingsCache(tmp_path)
+    path = _cached_at(cache, "2023-24", datetime(2024, 2, 1))
+    assert not cache._is_fresh("2023-24", path)
+
+
+def test_completed_season_cached_after_it_ended_is_final(tmp_path):
+    cache = StandingsCache(tmp_path)
+    path = _cached_at(cache, "2023-24", datetime(2024, 8, 1))
+    assert cache._is_fresh("2023-24", path)